@@ -1,6 +1,7 @@
 """Application configuration."""
 
-from typing import List, Union
+from functools import lru_cache
+from typing import FrozenSet, List, Union
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
@@ -14,13 +15,16 @@ class Settings(BaseSettings):
     # Database Configuration
     DATABASE_URL: str = "sqlite:///./resume_refiner.db"
 
+    # Storage Configuration (optional Redis backend for uploads/analyses)
+    REDIS_URL: str = ""
+
     # CORS Configuration
     ALLOWED_ORIGINS: Union[List[str], str] = ["http://localhost:5173", "http://localhost:3000"]
 
     # File Upload Configuration
     MAX_FILE_SIZE: int = 10485760  # 10MB in bytes
     UPLOAD_DIR: str = "./uploads"
-    ALLOWED_EXTENSIONS: Union[List[str], str] = [".pdf", ".docx"]
+    ALLOWED_EXTENSIONS: Union[FrozenSet[str], str] = frozenset({".pdf", ".docx"})
 
     @field_validator("ALLOWED_ORIGINS", mode="before")
     @classmethod
@@ -33,10 +37,14 @@ class Settings(BaseSettings):
     @field_validator("ALLOWED_EXTENSIONS", mode="before")
     @classmethod
     def parse_allowed_extensions(cls, v):
-        """Parse comma-separated ALLOWED_EXTENSIONS string from .env file."""
+        """Parse comma-separated ALLOWED_EXTENSIONS string from .env file.
+
+        Normalizes to a lowercase frozenset so per-upload membership checks
+        are O(1) and don't need a .lower() call.
+        """
         if isinstance(v, str):
-            return [ext.strip() for ext in v.split(",")]
-        return v
+            return frozenset(ext.strip().lower() for ext in v.split(","))
+        return frozenset(ext.lower() for ext in v)
 
     class Config:
         """Pydantic config."""
@@ -44,4 +52,12 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the shared Settings instance.
+
+    Lazily reads .env and runs validation on first use instead of at module
+    import, so fork-imported workers don't each pay the cost before serving.
+    The cache also allows test-time overrides via get_settings.cache_clear().
+    """
+    return Settings()
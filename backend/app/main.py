@@ -4,7 +4,8 @@ import logging
 import sys
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.config import settings
+from fastapi.responses import ORJSONResponse
+from app.config import get_settings
 from app.routers import upload, analyze, export
 
 # Configure logging
@@ -23,6 +24,7 @@ app = FastAPI(
     title="Resume Refiner API",
     description="AI-powered resume analysis and optimization",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 logger.info("Resume Refiner API starting up...")
@@ -30,7 +32,7 @@ logger.info("Resume Refiner API starting up...")
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    allow_origins=get_settings().ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
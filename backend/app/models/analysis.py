@@ -1,10 +1,15 @@
 """Analysis data models."""
 
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from functools import partial
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 from uuid import UUID, uuid4
 
+# datetime.utcnow() is deprecated (3.12+) and returns a naive datetime;
+# partial avoids per-instance lambda dispatch in the default factory
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 class GrammarIssue(BaseModel):
     """Grammar issue model."""
@@ -22,7 +27,9 @@ class ATSSuggestion(BaseModel):
 
     category: str  # e.g., "keywords", "formatting", "sections"
     message: str
-    importance: str  # "high", "medium", "low"
+    # Literal lets pydantic-core validate against interned constants instead
+    # of allocating a fresh str per suggestion
+    importance: Literal["high", "medium", "low"]
     current_value: Optional[str] = None
     suggested_value: Optional[str] = None
 
@@ -34,7 +41,7 @@ class ContentSuggestion(BaseModel):
     original_text: str
     suggested_text: str
     explanation: str
-    impact: str  # "high", "medium", "low"
+    impact: Literal["high", "medium", "low"]
 
 
 class Analysis(BaseModel):
@@ -42,7 +49,7 @@ class Analysis(BaseModel):
 
     id: UUID = Field(default_factory=uuid4)
     resume_id: UUID
-    analysis_date: datetime = Field(default_factory=datetime.utcnow)
+    analysis_date: datetime = Field(default_factory=_utcnow)
     overall_score: float = Field(ge=0, le=100)
     grammar_score: Optional[float] = Field(default=None, ge=0, le=100)
     ats_score: Optional[float] = Field(default=None, ge=0, le=100)
@@ -51,10 +58,3 @@ class Analysis(BaseModel):
     ats_suggestions: List[ATSSuggestion] = Field(default_factory=list)
     content_suggestions: List[ContentSuggestion] = Field(default_factory=list)
     formatting_issues: List[str] = Field(default_factory=list)
-
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat(),
-        }
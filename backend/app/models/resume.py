@@ -1,10 +1,24 @@
 """Resume data models."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from uuid import UUID, uuid4
 
+# datetime.utcnow() is deprecated (3.12+) and returns a naive datetime;
+# partial avoids per-instance lambda dispatch in the default factory
+_utcnow = partial(datetime.now, timezone.utc)
+
+# One bit per known section so presence checks collapse to integer masks
+SECTION_BITS = {
+    'contact': 1,
+    'summary': 2,
+    'experience': 4,
+    'education': 8,
+    'skills': 16,
+}
+
 
 class ContactInfo(BaseModel):
     """Contact information model."""
@@ -59,8 +73,53 @@ class ResumeContent(BaseModel):
     education: List[Education] = Field(default_factory=list)
     skills: List[Skill] = Field(default_factory=list)
     raw_text: str = ""
+    raw_text_len: int = 0  # Set at parse time so scoring never touches raw_text
     sections: Dict[str, Any] = Field(default_factory=dict)
 
+    # Flattened views cached per instance so each consuming service doesn't
+    # re-walk the nested experience/skills lists
+    _flat_bullets: Optional[List[str]] = PrivateAttr(default=None)
+    _keyword_set: Optional[frozenset] = PrivateAttr(default=None)
+    _total_skills: Optional[int] = PrivateAttr(default=None)
+    _section_mask: Optional[int] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        """Derive raw_text_len when unset so it can't drift from raw_text."""
+        if not self.raw_text_len and self.raw_text:
+            self.raw_text_len = len(self.raw_text)
+
+    def get_flat_bullets(self) -> List[str]:
+        """Get all experience bullets as one flat list (computed once)."""
+        if self._flat_bullets is None:
+            self._flat_bullets = [
+                bullet for exp in self.experience for bullet in exp.bullets
+            ]
+        return self._flat_bullets
+
+    def get_keyword_set(self) -> frozenset:
+        """Get all skill strings lowercased as a set (computed once)."""
+        if self._keyword_set is None:
+            self._keyword_set = frozenset(
+                skill.lower() for group in self.skills for skill in group.skills
+            )
+        return self._keyword_set
+
+    def get_section_mask(self) -> int:
+        """Get detected sections as a bitmask (computed once)."""
+        if self._section_mask is None:
+            mask = 0
+            for section in self.sections:
+                mask |= SECTION_BITS.get(section, 0)
+            self._section_mask = mask
+        return self._section_mask
+
+    def get_total_skills(self) -> int:
+        """Get the total skill count across groups (computed once)."""
+        if self._total_skills is None:
+            # map dispatches len in C over the group lists
+            self._total_skills = sum(map(len, (s.skills for s in self.skills)))
+        return self._total_skills
+
 
 class ResumeUpload(BaseModel):
     """Resume upload model."""
@@ -68,14 +127,7 @@ class ResumeUpload(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     user_id: Optional[str] = None
     filename: str
-    upload_date: datetime = Field(default_factory=datetime.utcnow)
+    upload_date: datetime = Field(default_factory=_utcnow)
     file_type: str  # "pdf" or "docx"
     file_path: str
     content: Optional[ResumeContent] = None
-
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat(),
-        }
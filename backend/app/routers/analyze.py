@@ -1,10 +1,13 @@
 """Analysis endpoints with grammar checking and scoring."""
 
+import asyncio
 import logging
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
 from uuid import UUID
 from typing import Optional, List
+from app import storage
 from app.models.analysis import Analysis, GrammarIssue, ATSSuggestion, ContentSuggestion
 from app.services.grammar_checker import GrammarChecker
 from app.services.ats_optimizer import ATSOptimizer
@@ -15,9 +18,27 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory storage for demonstration
-# TODO: Replace with database
-analyses_db = {}
+# Prebuilt adapter so grammar responses serialize in one pydantic-core call
+# instead of FastAPI rebuilding the list validator per request
+_grammar_issue_list_adapter = TypeAdapter(List[GrammarIssue])
+
+
+@lru_cache(maxsize=1)
+def get_grammar_checker() -> GrammarChecker:
+    """Get shared GrammarChecker instance (constructed once per process)."""
+    return GrammarChecker()
+
+
+@lru_cache(maxsize=1)
+def get_ats_optimizer() -> ATSOptimizer:
+    """Get shared ATSOptimizer instance (constructed once per process)."""
+    return ATSOptimizer()
+
+
+@lru_cache(maxsize=1)
+def get_claude_service() -> ClaudeService:
+    """Get shared ClaudeService instance (constructed once per process)."""
+    return ClaudeService()
 
 
 class AnalyzeRequest(BaseModel):
@@ -41,56 +62,65 @@ class ATSCheckRequest(BaseModel):
 
 
 @router.post("/", response_model=Analysis)
-async def analyze_resume(request: AnalyzeRequest):
+async def analyze_resume(
+    request: AnalyzeRequest,
+    grammar_checker: GrammarChecker = Depends(get_grammar_checker),
+    ats_optimizer: ATSOptimizer = Depends(get_ats_optimizer),
+    claude_service: ClaudeService = Depends(get_claude_service),
+):
     """
     Perform full resume analysis with grammar check and scoring.
 
     Args:
         request: Analysis request with resume ID and optional job description
+        grammar_checker: Shared grammar checking service
+        ats_optimizer: Shared ATS optimization service
+        claude_service: Shared Claude API service
 
     Returns:
         Complete analysis results
     """
-    logger.info(f"Starting analysis for resume ID: {request.resume_id}")
-
-    # Import here to avoid circular import
-    from app.routers.upload import uploads_db
+    logger.info("Starting analysis for resume ID: %s", request.resume_id)
 
     # Get resume
-    if request.resume_id not in uploads_db:
-        logger.error(f"Resume not found: {request.resume_id}")
+    resume = await storage.get_resume(request.resume_id)
+    if resume is None:
+        logger.error("Resume not found: %s", request.resume_id)
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume = uploads_db[request.resume_id]
-
     if not resume.content:
-        logger.error(f"Resume content not parsed: {request.resume_id}")
+        logger.error("Resume content not parsed: %s", request.resume_id)
         raise HTTPException(status_code=400, detail="Resume content not parsed")
 
-    try:
-        # Initialize services
-        grammar_checker = GrammarChecker()
-        ats_optimizer = ATSOptimizer()
-        claude_service = ClaudeService()
-
-        logger.info("Running grammar check...")
-        # Run grammar check
-        grammar_issues = await grammar_checker.check_grammar(resume.content.raw_text)
-
-        logger.info("Running ATS analysis...")
-        # Run ATS analysis
-        ats_score_raw, ats_suggestions = await ats_optimizer.analyze_ats_compatibility(
-            resume.content, request.job_description
+    # Don't spend a Claude call and grammar pass on empty extractions
+    if not resume.content.raw_text.strip():
+        logger.error("Resume text is empty: %s", request.resume_id)
+        raise HTTPException(
+            status_code=400,
+            detail="Resume text is empty. Please re-upload the document.",
         )
 
-        logger.info("Running content analysis...")
-        # Run AI content analysis (placeholder for now)
-        content_suggestions = await claude_service.analyze_content(resume.content)
+    try:
+        logger.info("Running grammar, ATS and content analyses concurrently...")
+        # The three analyses are independent (they only read resume.content),
+        # so run them concurrently; wall-time collapses to the slowest of the
+        # three instead of their sum.
+        (
+            grammar_issues,
+            (ats_score_raw, ats_suggestions),
+            content_suggestions,
+        ) = await asyncio.gather(
+            grammar_checker.check_grammar(resume.content.raw_text),
+            ats_optimizer.analyze_ats_compatibility(
+                resume.content, request.job_description
+            ),
+            claude_service.analyze_content(resume.content),
+        )
 
         # Calculate scores using scoring service
         logger.info("Calculating scores...")
         grammar_score = ResumeScorer.calculate_grammar_score(
-            len(resume.content.raw_text),
+            resume.content.raw_text_len,
             grammar_issues
         )
 
@@ -107,8 +137,10 @@ async def analyze_resume(request: AnalyzeRequest):
             content_score
         )
 
-        # Create analysis record
-        analysis = Analysis(
+        # Create analysis record. The scores and suggestion lists were just
+        # produced by our own services, so skip pydantic re-validation of
+        # every nested model with model_construct (defaults still apply).
+        analysis = Analysis.model_construct(
             resume_id=resume.id,
             overall_score=overall_score,
             grammar_score=grammar_score,
@@ -120,16 +152,17 @@ async def analyze_resume(request: AnalyzeRequest):
         )
 
         # Store analysis
-        analyses_db[str(analysis.id)] = analysis
+        await storage.set_analysis(analysis)
 
-        logger.info(f"Analysis completed for {request.resume_id}: "
-                   f"overall={overall_score:.1f}, grammar={grammar_score:.1f}, "
-                   f"ats={ats_score:.1f}, content={content_score:.1f}")
+        logger.info("Analysis completed for %s: "
+                   "overall=%.1f, grammar=%.1f, ats=%.1f, content=%.1f",
+                   request.resume_id, overall_score, grammar_score,
+                   ats_score, content_score)
 
         return analysis
 
     except Exception as e:
-        logger.exception(f"Analysis failed for {request.resume_id}")
+        logger.exception("Analysis failed for %s", request.resume_id)
         raise HTTPException(status_code=500, detail="Analysis failed. Please try again.")
 
 
@@ -144,34 +177,43 @@ async def get_analysis(analysis_id: str):
     Returns:
         Analysis results
     """
-    logger.info(f"Retrieving analysis: {analysis_id}")
+    logger.info("Retrieving analysis: %s", analysis_id)
 
-    if analysis_id not in analyses_db:
-        logger.error(f"Analysis not found: {analysis_id}")
+    # Analyses are immutable once stored, so serve the JSON bytes serialized
+    # at store time instead of re-serializing the model on every read
+    analysis_json = await storage.get_analysis_json(analysis_id)
+    if analysis_json is None:
+        logger.error("Analysis not found: %s", analysis_id)
         raise HTTPException(status_code=404, detail="Analysis not found")
 
-    return analyses_db[analysis_id]
+    return Response(content=analysis_json, media_type="application/json")
 
 
 @router.post("/grammar", response_model=List[GrammarIssue])
-async def check_grammar(request: GrammarCheckRequest):
+async def check_grammar(
+    request: GrammarCheckRequest,
+    grammar_checker: GrammarChecker = Depends(get_grammar_checker),
+):
     """
     Run grammar check on text.
 
     Args:
         request: Grammar check request
+        grammar_checker: Shared grammar checking service
 
     Returns:
         List of grammar issues
     """
-    logger.info(f"Grammar check requested for {len(request.text)} characters")
+    logger.info("Grammar check requested for %d characters", len(request.text))
 
     try:
-        grammar_checker = GrammarChecker()
         issues = await grammar_checker.check_grammar(request.text)
 
-        logger.info(f"Grammar check found {len(issues)} issues")
-        return issues
+        logger.info("Grammar check found %d issues", len(issues))
+        return Response(
+            content=_grammar_issue_list_adapter.dump_json(issues),
+            media_type="application/json",
+        )
 
     except Exception as e:
         logger.exception("Grammar check failed")
@@ -179,37 +221,44 @@ async def check_grammar(request: GrammarCheckRequest):
 
 
 @router.post("/ats", response_model=dict)
-async def check_ats(request: ATSCheckRequest):
+async def check_ats(
+    request: ATSCheckRequest,
+    ats_optimizer: ATSOptimizer = Depends(get_ats_optimizer),
+):
     """
     Run ATS optimization check.
 
     Args:
         request: ATS check request
+        ats_optimizer: Shared ATS optimization service
 
     Returns:
         ATS score and suggestions
     """
-    logger.info(f"ATS check requested for resume: {request.resume_id}")
+    logger.info("ATS check requested for resume: %s", request.resume_id)
 
-    from app.routers.upload import uploads_db
-
-    if request.resume_id not in uploads_db:
-        logger.error(f"Resume not found: {request.resume_id}")
+    resume = await storage.get_resume(request.resume_id)
+    if resume is None:
+        logger.error("Resume not found: %s", request.resume_id)
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume = uploads_db[request.resume_id]
-
     if not resume.content:
-        logger.error(f"Resume content not parsed: {request.resume_id}")
+        logger.error("Resume content not parsed: %s", request.resume_id)
         raise HTTPException(status_code=400, detail="Resume content not parsed")
 
+    if not resume.content.raw_text.strip():
+        logger.error("Resume text is empty: %s", request.resume_id)
+        raise HTTPException(
+            status_code=400,
+            detail="Resume text is empty. Please re-upload the document.",
+        )
+
     try:
-        ats_optimizer = ATSOptimizer()
         score, suggestions = await ats_optimizer.analyze_ats_compatibility(
             resume.content, request.job_description
         )
 
-        logger.info(f"ATS check completed: score={score}, suggestions={len(suggestions)}")
+        logger.info("ATS check completed: score=%s, suggestions=%d", score, len(suggestions))
         return {"score": score, "suggestions": suggestions}
 
     except Exception as e:
@@ -1,9 +1,9 @@
 """Export endpoints."""
 
+import io
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
-from pathlib import Path
-from uuid import uuid4
+from fastapi.responses import StreamingResponse
+from app import storage
 from app.services.formatter import DocumentFormatter
 
 router = APIRouter()
@@ -20,38 +20,33 @@ async def export_pdf(analysis_id: str):
     Returns:
         PDF file
     """
-    from app.routers.analyze import analyses_db
-    from app.routers.upload import uploads_db
-
     # Get analysis
-    if analysis_id not in analyses_db:
+    analysis = await storage.get_analysis(analysis_id)
+    if analysis is None:
         raise HTTPException(status_code=404, detail="Analysis not found")
 
-    analysis = analyses_db[analysis_id]
-
     # Get resume
-    resume_id = str(analysis.resume_id)
-    if resume_id not in uploads_db:
+    resume = await storage.get_resume(str(analysis.resume_id))
+    if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume = uploads_db[resume_id]
-
     if not resume.content:
         raise HTTPException(status_code=400, detail="Resume content not available")
 
     try:
-        # Generate PDF
+        # Generate PDF into an in-memory buffer and stream it directly,
+        # avoiding the write-to-disk + FileResponse re-read round-trip
         formatter = DocumentFormatter()
-        output_dir = Path("./exports")
-        output_dir.mkdir(exist_ok=True)
-
-        output_path = output_dir / f"{uuid4()}.pdf"
-        pdf_path = await formatter.generate_pdf(resume.content, str(output_path))
+        buffer = io.BytesIO()
+        await formatter.generate_pdf(resume.content, buffer)
+        buffer.seek(0)
 
-        return FileResponse(
-            pdf_path,
+        return StreamingResponse(
+            buffer,
             media_type="application/pdf",
-            filename=f"resume_refined_{analysis_id[:8]}.pdf",
+            headers={
+                "Content-Disposition": f"attachment; filename=resume_refined_{analysis_id[:8]}.pdf"
+            },
         )
 
     except Exception as e:
@@ -69,38 +64,32 @@ async def export_docx(analysis_id: str):
     Returns:
         DOCX file
     """
-    from app.routers.analyze import analyses_db
-    from app.routers.upload import uploads_db
-
     # Get analysis
-    if analysis_id not in analyses_db:
+    analysis = await storage.get_analysis(analysis_id)
+    if analysis is None:
         raise HTTPException(status_code=404, detail="Analysis not found")
 
-    analysis = analyses_db[analysis_id]
-
     # Get resume
-    resume_id = str(analysis.resume_id)
-    if resume_id not in uploads_db:
+    resume = await storage.get_resume(str(analysis.resume_id))
+    if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume = uploads_db[resume_id]
-
     if not resume.content:
         raise HTTPException(status_code=400, detail="Resume content not available")
 
     try:
-        # Generate DOCX
+        # Generate DOCX into an in-memory buffer and stream it directly
         formatter = DocumentFormatter()
-        output_dir = Path("./exports")
-        output_dir.mkdir(exist_ok=True)
-
-        output_path = output_dir / f"{uuid4()}.docx"
-        docx_path = await formatter.generate_docx(resume.content, str(output_path))
+        buffer = io.BytesIO()
+        await formatter.generate_docx(resume.content, buffer)
+        buffer.seek(0)
 
-        return FileResponse(
-            docx_path,
+        return StreamingResponse(
+            buffer,
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=f"resume_refined_{analysis_id[:8]}.docx",
+            headers={
+                "Content-Disposition": f"attachment; filename=resume_refined_{analysis_id[:8]}.docx"
+            },
         )
 
     except Exception as e:
@@ -4,6 +4,7 @@ import logging
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
 from uuid import UUID
 from datetime import datetime
+from app import storage
 from app.models.resume import ResumeUpload
 from app.utils.file_handler import save_upload_file
 from app.utils.file_cleanup import cleanup_old_files
@@ -13,10 +14,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory storage for demonstration (replace with database in production)
-# TODO: Replace with proper database implementation
-uploads_db = {}
-
 
 @router.post("/", response_model=ResumeUpload)
 async def upload_resume(
@@ -33,19 +30,20 @@ async def upload_resume(
     Returns:
         ResumeUpload object with upload details
     """
-    logger.info(f"Received upload request for file: {file.filename}")
+    logger.info("Received upload request for file: %s", file.filename)
 
     try:
         # Save file
         file_path, file_type = await save_upload_file(file)
-        logger.info(f"File saved: {file_path}")
+        logger.info("File saved: %s", file_path)
 
-        # Parse document
+        # Parse without blocking the event loop: the file read is async
+        # and the CPU-bound extraction runs on a worker thread
         try:
-            content = DocumentParser.parse(file_path, file_type)
-            logger.info(f"Document parsed successfully: {file_path}")
+            content = await DocumentParser.parse_async(file_path, file_type)
+            logger.info("Document parsed successfully: %s", file_path)
         except Exception as e:
-            logger.error(f"Parsing failed for {file_path}: {e}", exc_info=True)
+            logger.error("Parsing failed for %s: %s", file_path, e, exc_info=True)
             # Continue even if parsing fails
             content = None
 
@@ -57,9 +55,9 @@ async def upload_resume(
             content=content,
         )
 
-        # Store in database
-        uploads_db[str(upload.id)] = upload
-        logger.info(f"Upload record created with ID: {upload.id}")
+        # Store record
+        await storage.set_resume(upload)
+        logger.info("Upload record created with ID: %s", upload.id)
 
         # Schedule file cleanup as background task
         if background_tasks:
@@ -71,7 +69,7 @@ async def upload_resume(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Upload failed for {file.filename}")
+        logger.exception("Upload failed for %s", file.filename)
         raise HTTPException(status_code=500, detail="Upload failed. Please try again.")
 
 
@@ -86,7 +84,8 @@ async def get_upload(upload_id: str):
     Returns:
         ResumeUpload object
     """
-    if upload_id not in uploads_db:
+    upload = await storage.get_resume(upload_id)
+    if upload is None:
         raise HTTPException(status_code=404, detail="Upload not found")
 
-    return uploads_db[upload_id]
+    return upload
@@ -1,6 +1,9 @@
 """ATS optimization service."""
 
-from typing import List, Tuple
+from typing import List, Set, Tuple
+
+import ahocorasick
+
 from app.models.resume import ResumeContent
 from app.models.analysis import ATSSuggestion
 
@@ -29,6 +32,33 @@ class ATSOptimizer:
         suggestions = []
         return score, suggestions
 
+    @staticmethod
+    def match_keywords(text: str, keywords: List[str]) -> Set[str]:
+        """
+        Find which keywords appear in text with a single linear scan.
+
+        An Aho-Corasick automaton over the lowercased keywords streams the
+        text once in O(len(text) + matches), instead of one substring scan
+        per keyword.
+
+        Args:
+            text: Text to scan (e.g. resume raw text)
+            keywords: Keywords to look for (case-insensitive)
+
+        Returns:
+            Set of keywords found in the text
+        """
+        if not text or not keywords:
+            return set()
+
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            if keyword:
+                automaton.add_word(keyword.lower(), keyword)
+        automaton.make_automaton()
+
+        return {keyword for _, keyword in automaton.iter(text.lower())}
+
     @staticmethod
     async def extract_keywords(text: str) -> List[str]:
         """
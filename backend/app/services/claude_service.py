@@ -1,10 +1,19 @@
 """Claude API service for AI-powered analysis."""
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import List, Optional, Dict, Any
+import random
+import re
+from functools import lru_cache
+from itertools import chain
+from typing import List, Optional, Dict, Any, Tuple
+import httpx
+import orjson
 from anthropic import AsyncAnthropic, APIError, APITimeoutError, RateLimitError
-from app.config import settings
+from cachetools import TTLCache
+from app.config import get_settings
 from app.models.resume import ResumeContent, Experience
 from app.models.analysis import ContentSuggestion
 
@@ -15,29 +24,375 @@ class ClaudeConfig:
     """Configuration for Claude API service."""
 
     MODEL = "claude-3-5-sonnet-20241022"
+    # Single-suggestion analysis is well within Haiku's capability at a
+    # fraction of Sonnet's cost and latency; Sonnet handles the rewrites
+    SUGGESTION_MODEL = "claude-3-5-haiku-20241022"
     MAX_TOKENS = 4096
     TEMPERATURE = 0.7
+
+    # Per-call output caps: a single-suggestion tool call is ~150 tokens and
+    # an improved summary 2-3 sentences, so requesting 4096 everywhere just
+    # slows decoding and inflates the worst-case bill
+    SUGGESTION_MAX_TOKENS = 512
+    SUMMARY_MAX_TOKENS = 400
+    BULLETS_PER_ITEM_TOKENS = 80
     MAX_RETRIES = 2
     TIMEOUT = 60.0  # seconds
     MAX_TEXT_LENGTH = 100000  # Max chars to send to Claude
 
+    # Input token budget per prompt. Counted with the ~4 chars/token
+    # English-prose estimate rather than a tokenizer round-trip; the point
+    # is to stay well inside context limits without a network call
+    MAX_INPUT_TOKENS = 8000
+    CHARS_PER_TOKEN = 4
+
+    # Batch API polling
+    BATCH_POLL_INTERVAL = 2.0  # seconds
+    BATCH_TIMEOUT = 60.0  # seconds before falling back to per-call requests
+
+    # Concurrency cap for the analyze fan-out (stays under Anthropic RPM/TPM)
+    MAX_CONCURRENCY = 8
+
+
+def _truncate_to_tokens(text: str, limit: int = None) -> str:
+    """Trim text to approximately ``limit`` input tokens.
+
+    Converts the budget to characters with the CHARS_PER_TOKEN estimate and
+    backs up to the previous whitespace so the cut never lands mid-word —
+    a mid-token cut both confuses the model and wastes the final token.
+    """
+    max_chars = (limit or ClaudeConfig.MAX_INPUT_TOKENS) * ClaudeConfig.CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = max(text.rfind("\n", 0, max_chars), text.rfind(" ", 0, max_chars))
+    return text[:cut] if cut > 0 else text[:max_chars]
+
+
+def _extract_json(text: str) -> Dict[str, Any]:
+    """Extract the first JSON object embedded in a model response.
+
+    Parses from the opening brace, so markdown fences, leading prose, or a
+    trailing explanation are skipped without any intermediate string surgery.
+    orjson handles the common well-formed case; stdlib ``raw_decode`` is the
+    fallback when trailing text confuses a whole-slice parse.
+
+    Raises:
+        json.JSONDecodeError: If no JSON object can be decoded
+    """
+    start = text.find("{")
+    if start < 0:
+        raise json.JSONDecodeError("no JSON object found", text, 0)
+    end = text.rfind("}")
+    try:
+        return orjson.loads(text[start:end + 1])
+    except orjson.JSONDecodeError:
+        obj, _ = json.JSONDecoder().raw_decode(text, start)
+        return obj
+
+
+def _cacheable_system(text: str) -> List[Dict[str, Any]]:
+    """Wrap instruction text in a system block marked for prompt caching."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+@lru_cache(maxsize=256)
+def _render_experience_prompt(position: str, company: str,
+                              bullets: Tuple[str, ...]) -> str:
+    """Render the experience user message, memoized per entry.
+
+    The same resume is typically analyzed repeatedly (retry, re-score,
+    live preview); hashable args let identical experiences skip the
+    string building entirely.
+    """
+    bullets_text = _truncate_to_tokens("\n".join(f"- {bullet}" for bullet in bullets))
+
+    return (f'Position: "{position}" at "{company}"\n\n'
+            f"Current Bullet Points:\n{bullets_text}")
+
+
+# Strips list numbering ("1.", "2)") or bullet markers (-, *, •) and
+# surrounding whitespace in one scan, replacing several per-line string ops
+_BULLET_RE = re.compile(r'^\s*(?:\d+[.)]\s+|[-*•]\s+)?(.*?\S)\s*$')
+
+
+# Forced tool call whose input_schema mirrors ContentSuggestion: the model
+# must emit schema-valid arguments, so responses need no JSON string parsing
+_SUGGEST_TOOL = {
+    "name": "suggest",
+    "description": "Record one resume improvement suggestion.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "original_text": {"type": "string"},
+            "suggested_text": {"type": "string"},
+            "explanation": {"type": "string"},
+            "impact": {"type": "string", "enum": ["low", "medium", "high"]},
+        },
+        "required": ["original_text", "suggested_text", "explanation"],
+    },
+}
+_SUGGEST_TOOL_CHOICE = {"type": "tool", "name": "suggest"}
+
+# Fused variant for the multi-experience call: one suggestion per entry,
+# correlated back by index
+_SUGGEST_BATCH_TOOL = {
+    "name": "suggest_batch",
+    "description": "Record one resume improvement suggestion per experience entry.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "suggestions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "index": {"type": "integer"},
+                        "original_text": {"type": "string"},
+                        "suggested_text": {"type": "string"},
+                        "explanation": {"type": "string"},
+                        "impact": {"type": "string", "enum": ["low", "medium", "high"]},
+                    },
+                    "required": ["index", "original_text", "suggested_text", "explanation"],
+                },
+            },
+        },
+        "required": ["suggestions"],
+    },
+}
+_SUGGEST_BATCH_TOOL_CHOICE = {"type": "tool", "name": "suggest_batch"}
+
+
+# Static instruction prefixes, hoisted to module level so they are
+# byte-identical across calls (a requirement for Anthropic prompt cache hits).
+# The API then skips reprocessing the prefix and only the short dynamic user
+# message is processed in full.
+_SUMMARY_SYSTEM = _cacheable_system("""Analyze the professional resume summary provided by the user and provide ONE specific, actionable improvement suggestion.
+
+Focus on:
+1. Impact and achievements (use metrics/numbers)
+2. Clear value proposition
+3. Active voice and strong action verbs
+4. Conciseness (2-3 sentences ideal)
+5. Relevance to career goals
+
+Report your suggestion by calling the "suggest" tool.""")
+
+_EXPERIENCE_SYSTEM = _cacheable_system("""Analyze the resume bullet points provided by the user for the given position and company.
+
+Provide ONE specific improvement for the weakest bullet point.
+
+Best practices:
+1. Start with strong action verbs
+2. Include quantifiable metrics and results
+3. Follow the format: "Action Verb + Task + Result/Impact"
+4. Be specific and concrete
+5. Focus on achievements, not just responsibilities
+
+Report your suggestion by calling the "suggest" tool.""")
+
+_EXPERIENCES_SYSTEM = _cacheable_system("""Analyze the resume experience entries provided by the user. Each entry is introduced by its index in square brackets, followed by the position, company, and bullet points.
+
+For every entry, provide ONE specific improvement for its weakest bullet point.
+
+Best practices:
+1. Start with strong action verbs
+2. Include quantifiable metrics and results
+3. Follow the format: "Action Verb + Task + Result/Impact"
+4. Be specific and concrete
+5. Focus on achievements, not just responsibilities
+
+Report the suggestions by calling the "suggest_batch" tool with one item per entry, carrying the entry's index.""")
+
+_SKILLS_SYSTEM = _cacheable_system("""Analyze the resume skills section provided by the user and provide ONE specific improvement suggestion.
+
+Focus on:
+1. Organization and categorization
+2. Relevance and priority (put most important skills first)
+3. Specificity (avoid vague terms)
+4. Industry-standard terminology
+5. Balance of technical and soft skills
+
+Report your suggestion by calling the "suggest" tool.""")
+
+_IMPROVE_SUMMARY_SYSTEM = _cacheable_system("""Improve the professional resume summary provided by the user. Make it more impactful, concise, and achievement-focused.
+
+Requirements:
+1. Keep it 2-3 sentences (50-80 words)
+2. Start with your professional identity
+3. Include 1-2 key achievements with metrics if possible
+4. End with value proposition or career goals
+5. Use active voice and strong action verbs
+6. Make it compelling and specific
+
+Return ONLY the improved summary text, nothing else.""")
+
+_IMPROVE_BULLETS_SYSTEM = _cacheable_system("""Improve the resume bullet points provided by the user. Make them more impactful and achievement-focused.
+
+Requirements for each bullet:
+1. Start with a strong action verb (past tense for previous roles)
+2. Include specific metrics, percentages, or numbers
+3. Follow format: "Action Verb + Task + Result/Impact"
+4. Be concise (1-2 lines max)
+5. Focus on achievements and outcomes, not just responsibilities
+
+Return ONLY the improved bullet points as a numbered list (1., 2., 3., etc.), nothing else.""")
+
+
+class ClaudeResponseCache:
+    """Exact-match response cache for Claude calls.
+
+    Keys are a hash of (model, prompt, temperature), so identical inputs --
+    repeat submissions, dev/test loops -- skip the API call entirely. Only
+    successfully parsed results are stored.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def make_key(prompt: str, system: Optional[List[Dict[str, Any]]] = None,
+                 model: str = None) -> str:
+        """Compute the cache key for a prompt under the current config."""
+        payload = orjson.dumps(
+            {
+                "model": model or ClaudeConfig.MODEL,
+                "system": system[0]["text"] if system else "",
+                "prompt": prompt,
+                "temp": ClaudeConfig.TEMPERATURE,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    async def get(self, key: str):
+        """Get a cached result, or None on miss/expiry."""
+        return self._cache.get(key)
+
+    async def set(self, key: str, value) -> None:
+        """Store a result."""
+        self._cache[key] = value
+
+    def clear(self) -> None:
+        """Drop all cached responses (used by tests)."""
+        self._cache.clear()
+
+
+# Shared across ClaudeService instances so cache hits survive re-instantiation
+_response_cache = ClaudeResponseCache()
+
+# Shared API client: one warm HTTP/2 connection pool for every ClaudeService
+# instance, instead of a cold TLS+TCP handshake per instantiation (FastAPI
+# dependency patterns may re-instantiate the service per request)
+_client: Optional[AsyncAnthropic] = None
+
+
+# Self-throttle the gather fan-out: without a cap a resume with many
+# experiences can trip Anthropic's rate limit and fail the whole batch
+_CLAUDE_SEM = asyncio.Semaphore(ClaudeConfig.MAX_CONCURRENCY)
+
+
+def _get_client() -> AsyncAnthropic:
+    """Get the process-wide AsyncAnthropic client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = AsyncAnthropic(
+            api_key=get_settings().CLAUDE_API_KEY,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=ClaudeConfig.TIMEOUT,
+            ),
+        )
+    return _client
+
 
 class ClaudeService:
     """Service for interacting with Claude API."""
 
     def __init__(self):
         """Initialize Claude service."""
-        self.api_key = settings.CLAUDE_API_KEY
+        self.api_key = get_settings().CLAUDE_API_KEY
         if not self.api_key:
             logger.warning("CLAUDE_API_KEY not configured - AI suggestions will be unavailable")
             self.client = None
         else:
-            self.client = AsyncAnthropic(api_key=self.api_key)
+            self.client = _get_client()
 
     def _is_available(self) -> bool:
         """Check if Claude API is available."""
         return self.client is not None
 
+    async def _create_with_retry(self, **kwargs):
+        """Call messages.create under the shared semaphore, retrying throttles.
+
+        Rate limits and timeouts back off exponentially (with jitter) for up
+        to MAX_RETRIES attempts before the error propagates to the caller's
+        normal handling.
+        """
+        for attempt in range(ClaudeConfig.MAX_RETRIES + 1):
+            try:
+                async with _CLAUDE_SEM:
+                    return await self.client.messages.create(**kwargs)
+            except (RateLimitError, APITimeoutError):
+                if attempt >= ClaudeConfig.MAX_RETRIES:
+                    raise
+                delay = 2 ** attempt + random.random() * 0.1
+                logger.warning(f"Claude API throttled, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _stream_text_with_retry(self, **kwargs) -> str:
+        """Stream a response under the shared semaphore and return its text.
+
+        Streaming consumes tokens as they arrive instead of waiting on the
+        fully buffered response, trimming time-to-result for the rewrite
+        endpoints. Throttle handling mirrors _create_with_retry.
+        """
+        for attempt in range(ClaudeConfig.MAX_RETRIES + 1):
+            try:
+                async with _CLAUDE_SEM:
+                    async with self.client.messages.stream(**kwargs) as stream:
+                        return await stream.get_final_text()
+            except (RateLimitError, APITimeoutError):
+                if attempt >= ClaudeConfig.MAX_RETRIES:
+                    raise
+                delay = 2 ** attempt + random.random() * 0.1
+                logger.warning(f"Claude API throttled, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _request_suggestion(self, system: List[Dict[str, Any]],
+                                  prompt: str) -> Dict[str, Any]:
+        """Request one suggestion, trying Haiku first and Sonnet on failure.
+
+        Raises:
+            json.JSONDecodeError: If neither model's response can be parsed
+        """
+        try:
+            response = await self._create_with_retry(
+                model=ClaudeConfig.SUGGESTION_MODEL,
+                max_tokens=ClaudeConfig.SUGGESTION_MAX_TOKENS,
+                temperature=ClaudeConfig.TEMPERATURE,
+                system=system,
+                tools=[_SUGGEST_TOOL],
+                tool_choice=_SUGGEST_TOOL_CHOICE,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return self._suggestion_input(response)
+        except (json.JSONDecodeError, KeyError):
+            logger.warning(
+                f"Unparseable {ClaudeConfig.SUGGESTION_MODEL} suggestion, "
+                f"retrying with {ClaudeConfig.MODEL}"
+            )
+            response = await self._create_with_retry(
+                model=ClaudeConfig.MODEL,
+                max_tokens=ClaudeConfig.SUGGESTION_MAX_TOKENS,
+                temperature=ClaudeConfig.TEMPERATURE,
+                system=system,
+                tools=[_SUGGEST_TOOL],
+                tool_choice=_SUGGEST_TOOL_CHOICE,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return self._suggestion_input(response)
+
     async def analyze_content(self, resume_content: ResumeContent) -> List[ContentSuggestion]:
         """
         Analyze resume content and provide suggestions.
@@ -52,23 +407,47 @@ class ClaudeService:
             logger.warning("Claude API not available - returning empty suggestions")
             return []
 
+        # Prefer the Batches API when several sections need analysis: one
+        # HTTP round-trip instead of one per section. Fall back to
+        # concurrent per-call requests on any batch failure.
+        specs = self._build_analysis_specs(resume_content)
+        if len(specs) > 1 and getattr(self.client.messages, "batches", None) is not None:
+            try:
+                suggestions = await self._batch_analyze(specs)
+                logger.info(f"Generated {len(suggestions)} content suggestions via batch")
+                return suggestions[:10]
+            except Exception as e:
+                logger.warning(f"Batch analysis failed, falling back to per-call requests: {e}")
+
         try:
-            suggestions = []
+            # Each section analysis is an independent network round-trip, so
+            # fire them concurrently; latency collapses to the slowest call
+            tasks = []
 
-            # Analyze summary if present
             if resume_content.summary:
-                summary_suggestions = await self._analyze_summary(resume_content.summary)
-                suggestions.extend(summary_suggestions)
+                tasks.append(self._analyze_summary(resume_content.summary))
 
-            # Analyze experience sections
-            for idx, exp in enumerate(resume_content.experience):
-                exp_suggestions = await self._analyze_experience(exp, idx)
-                suggestions.extend(exp_suggestions)
+            if resume_content.experience:
+                tasks.append(self._analyze_experiences(resume_content.experience))
 
-            # Analyze skills if present
             if resume_content.skills:
-                skills_suggestions = await self._analyze_skills(resume_content.skills)
-                suggestions.extend(skills_suggestions)
+                tasks.append(self._analyze_skills(resume_content.skills))
+
+            results = await asyncio.gather(
+                *(asyncio.wait_for(task, timeout=ClaudeConfig.TIMEOUT) for task in tasks),
+                return_exceptions=True,
+            )
+
+            # Flatten successful results; individual failures (including
+            # timeouts) degrade gracefully like the per-method error handling
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(f"Section analysis failed: {result}")
+
+            suggestions = list(chain.from_iterable(
+                result for result in results
+                if not isinstance(result, BaseException)
+            ))
 
             logger.info(f"Generated {len(suggestions)} content suggestions")
             return suggestions[:10]  # Limit to top 10 suggestions
@@ -86,138 +465,282 @@ class ClaudeService:
             logger.error(f"Unexpected error in analyze_content: {str(e)}", exc_info=True)
             return []
 
-    async def _analyze_summary(self, summary: str) -> List[ContentSuggestion]:
-        """Analyze professional summary and provide suggestions."""
-        if len(summary) > ClaudeConfig.MAX_TEXT_LENGTH:
-            summary = summary[:ClaudeConfig.MAX_TEXT_LENGTH]
+    def _build_analysis_specs(self, resume_content: ResumeContent) -> List[Dict[str, str]]:
+        """Build one request spec per analyzable section.
 
-        prompt = f"""Analyze this professional resume summary and provide ONE specific, actionable improvement suggestion.
+        Each spec carries the custom_id used to correlate batch results, the
+        suggestion section label, the prompt, and the default impact level.
+        """
+        specs = []
+
+        if resume_content.summary:
+            specs.append({
+                "custom_id": "summary",
+                "section": "summary",
+                "system": _SUMMARY_SYSTEM,
+                "prompt": self._build_summary_prompt(resume_content.summary),
+                "default_impact": "high",
+            })
+
+        for idx, exp in enumerate(resume_content.experience):
+            if exp.bullets:
+                specs.append({
+                    "custom_id": f"exp_{idx}",
+                    "section": f"experience_{idx}",
+                    "system": _EXPERIENCE_SYSTEM,
+                    "prompt": self._build_experience_prompt(exp),
+                    "default_impact": "high",
+                })
+
+        if resume_content.skills:
+            skills_prompt = self._build_skills_prompt(resume_content.skills)
+            if skills_prompt is not None:
+                specs.append({
+                    "custom_id": "skills",
+                    "section": "skills",
+                    "system": _SKILLS_SYSTEM,
+                    "prompt": skills_prompt,
+                    "default_impact": "medium",
+                })
+
+        return specs
+
+    async def _batch_analyze(self, specs: List[Dict[str, str]]) -> List[ContentSuggestion]:
+        """Analyze all sections in a single Messages Batches API request.
 
-Current Summary:
-{summary}
+        Args:
+            specs: Request specs from _build_analysis_specs
 
-Focus on:
-1. Impact and achievements (use metrics/numbers)
-2. Clear value proposition
-3. Active voice and strong action verbs
-4. Conciseness (2-3 sentences ideal)
-5. Relevance to career goals
+        Returns:
+            List of content suggestions in spec order
 
-Return your response as a JSON object with this exact structure:
-{{
-  "original_text": "the original summary text",
-  "suggested_text": "your improved version",
-  "explanation": "brief explanation of what you improved and why",
-  "impact": "high"
-}}
+        Raises:
+            TimeoutError: If the batch does not finish within BATCH_TIMEOUT
+        """
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": spec["custom_id"],
+                    "params": {
+                        "model": ClaudeConfig.SUGGESTION_MODEL,
+                        "max_tokens": ClaudeConfig.SUGGESTION_MAX_TOKENS,
+                        "temperature": ClaudeConfig.TEMPERATURE,
+                        "system": spec["system"],
+                        "tools": [_SUGGEST_TOOL],
+                        "tool_choice": _SUGGEST_TOOL_CHOICE,
+                        "messages": [{"role": "user", "content": spec["prompt"]}],
+                    },
+                }
+                for spec in specs
+            ]
+        )
+
+        # Poll until the batch finishes or the deadline passes
+        deadline = asyncio.get_event_loop().time() + ClaudeConfig.BATCH_TIMEOUT
+        while batch.processing_status != "ended":
+            if batch.processing_status not in ("in_progress", "canceling"):
+                raise RuntimeError(f"Unexpected batch status: {batch.processing_status}")
+            if asyncio.get_event_loop().time() >= deadline:
+                raise TimeoutError(f"Batch {batch.id} did not finish within "
+                                   f"{ClaudeConfig.BATCH_TIMEOUT}s")
+            await asyncio.sleep(ClaudeConfig.BATCH_POLL_INTERVAL)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        # Correlate results back to their sections via custom_id
+        specs_by_id = {spec["custom_id"]: spec for spec in specs}
+        suggestions_by_id: Dict[str, ContentSuggestion] = {}
+
+        async for entry in await self.client.messages.batches.results(batch.id):
+            spec = specs_by_id.get(entry.custom_id)
+            if spec is None:
+                continue
+
+            if entry.result.type != "succeeded":
+                logger.error(f"Batch entry {entry.custom_id} failed: {entry.result.type}")
+                continue
+
+            suggestion = self._suggestion_from_response(
+                entry.result.message.content[0],
+                spec["section"],
+                spec["default_impact"],
+            )
+            if suggestion is not None:
+                suggestions_by_id[entry.custom_id] = suggestion
 
-Important: Return ONLY the JSON object, no additional text."""
+        return [
+            suggestions_by_id[spec["custom_id"]]
+            for spec in specs
+            if spec["custom_id"] in suggestions_by_id
+        ]
 
+    @staticmethod
+    def _suggestion_input(response) -> Dict[str, Any]:
+        """Get the forced "suggest" tool call's input from a response.
+
+        Falls back to text extraction for responses (or mocks) that carry a
+        plain text block instead of a tool_use block.
+        """
+        block = response.content[0]
+        data = getattr(block, "input", None)
+        if isinstance(data, dict):
+            return data
+        return _extract_json(block.text)
+
+    @staticmethod
+    def _suggestion_from_response(block: Any, section: str,
+                                  default_impact: str) -> Optional[ContentSuggestion]:
+        """Build a ContentSuggestion from a response content block."""
         try:
-            response = await self.client.messages.create(
-                model=ClaudeConfig.MODEL,
-                max_tokens=ClaudeConfig.MAX_TOKENS,
-                temperature=ClaudeConfig.TEMPERATURE,
-                messages=[{"role": "user", "content": prompt}]
+            data = getattr(block, "input", None)
+            suggestion_data = data if isinstance(data, dict) else _extract_json(block.text)
+            return ContentSuggestion(
+                section=section,
+                original_text=suggestion_data["original_text"],
+                suggested_text=suggestion_data["suggested_text"],
+                explanation=suggestion_data["explanation"],
+                impact=suggestion_data.get("impact", default_impact)
             )
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.error(f"Failed to parse Claude response for {section}: {str(e)}")
+            return None
 
-            content = response.content[0].text.strip()
-            # Remove markdown code blocks if present
-            if content.startswith("```json"):
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif content.startswith("```"):
-                content = content.split("```")[1].split("```")[0].strip()
+    async def _one_suggestion(self, section: str, system: List[Dict[str, Any]],
+                              prompt: str, default_impact: str) -> List[ContentSuggestion]:
+        """Run the shared single-suggestion pipeline for one section.
 
-            suggestion_data = json.loads(content)
+        Cache lookup, model request, and ContentSuggestion construction live
+        here once, so caching, throttling, and model fallback apply to every
+        section analysis without being re-implemented per method.
+        """
+        cache_key = ClaudeResponseCache.make_key(prompt, system,
+                                                 ClaudeConfig.SUGGESTION_MODEL)
+        cached = await _response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Claude response cache hit for {section}")
+            return cached
 
-            return [ContentSuggestion(
-                section="summary",
+        try:
+            suggestion_data = await self._request_suggestion(system, prompt)
+
+            suggestions = [ContentSuggestion(
+                section=section,
                 original_text=suggestion_data["original_text"],
                 suggested_text=suggestion_data["suggested_text"],
                 explanation=suggestion_data["explanation"],
-                impact=suggestion_data.get("impact", "high")
+                impact=suggestion_data.get("impact", default_impact)
             )]
+            await _response_cache.set(cache_key, suggestions)
+            return suggestions
 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Claude response for summary: {str(e)}")
+            logger.error(f"Failed to parse Claude response for {section}: {str(e)}")
             return []
         except Exception as e:
-            logger.error(f"Error analyzing summary: {str(e)}", exc_info=True)
+            logger.error(f"Error analyzing {section}: {str(e)}", exc_info=True)
             return []
 
+    @staticmethod
+    def _build_summary_prompt(summary: str) -> str:
+        """Build the analysis prompt for a professional summary."""
+        summary = _truncate_to_tokens(summary)
+
+        return f"Current Summary:\n{summary}"
+
+    async def _analyze_summary(self, summary: str) -> List[ContentSuggestion]:
+        """Analyze professional summary and provide suggestions."""
+        prompt = self._build_summary_prompt(summary)
+        return await self._one_suggestion("summary", _SUMMARY_SYSTEM, prompt, "high")
+
+    @staticmethod
+    def _build_experience_prompt(experience: Experience) -> str:
+        """Build the analysis prompt for a work experience entry."""
+        # Analyze only the first 2-3 bullets to avoid overwhelming the response
+        return _render_experience_prompt(
+            experience.position, experience.company, tuple(experience.bullets[:3])
+        )
+
     async def _analyze_experience(self, experience: Experience, index: int) -> List[ContentSuggestion]:
         """Analyze work experience and provide suggestions."""
         if not experience.bullets:
             return []
 
-        # Analyze only the first 2-3 bullets to avoid overwhelming the response
-        bullets_to_analyze = experience.bullets[:3]
-        bullets_text = "\n".join(f"- {bullet}" for bullet in bullets_to_analyze)
-
-        if len(bullets_text) > ClaudeConfig.MAX_TEXT_LENGTH:
-            bullets_text = bullets_text[:ClaudeConfig.MAX_TEXT_LENGTH]
+        prompt = self._build_experience_prompt(experience)
+        return await self._one_suggestion(f"experience_{index}", _EXPERIENCE_SYSTEM,
+                                          prompt, "high")
 
-        prompt = f"""Analyze these resume bullet points for the position "{experience.position}" at "{experience.company}".
+    async def _analyze_experiences(self, experiences: List[Experience]) -> List[ContentSuggestion]:
+        """Analyze all experience entries in a single fused call.
 
-Current Bullet Points:
-{bullets_text}
-
-Provide ONE specific improvement for the weakest bullet point.
-
-Best practices:
-1. Start with strong action verbs
-2. Include quantifiable metrics and results
-3. Follow the format: "Action Verb + Task + Result/Impact"
-4. Be specific and concrete
-5. Focus on achievements, not just responsibilities
-
-Return your response as a JSON object with this exact structure:
-{{
-  "original_text": "the original bullet point",
-  "suggested_text": "your improved version",
-  "explanation": "brief explanation of improvements",
-  "impact": "high"
-}}
-
-Important: Return ONLY the JSON object, no additional text."""
+        One prompt carries every entry, so the instruction prefix is paid
+        once instead of once per experience. Falls back to per-experience
+        calls when the fused response cannot be used.
+        """
+        indexed = [(idx, exp) for idx, exp in enumerate(experiences) if exp.bullets]
+        if not indexed:
+            return []
+        if len(indexed) == 1:
+            idx, exp = indexed[0]
+            return await self._analyze_experience(exp, idx)
+
+        entries = []
+        for idx, exp in indexed:
+            bullets_text = "\n".join(f"- {bullet}" for bullet in exp.bullets[:3])
+            entries.append(f'[{idx}] Position: "{exp.position}" at "{exp.company}"\n'
+                           f"{bullets_text}")
+        prompt = _truncate_to_tokens("Experience Entries:\n\n" + "\n\n".join(entries))
+
+        cache_key = ClaudeResponseCache.make_key(prompt, _EXPERIENCES_SYSTEM,
+                                                 ClaudeConfig.SUGGESTION_MODEL)
+        cached = await _response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Claude response cache hit for experiences")
+            return cached
 
         try:
-            response = await self.client.messages.create(
-                model=ClaudeConfig.MODEL,
+            response = await self._create_with_retry(
+                model=ClaudeConfig.SUGGESTION_MODEL,
                 max_tokens=ClaudeConfig.MAX_TOKENS,
                 temperature=ClaudeConfig.TEMPERATURE,
+                system=_EXPERIENCES_SYSTEM,
+                tools=[_SUGGEST_BATCH_TOOL],
+                tool_choice=_SUGGEST_BATCH_TOOL_CHOICE,
                 messages=[{"role": "user", "content": prompt}]
             )
 
-            content = response.content[0].text.strip()
-            # Remove markdown code blocks if present
-            if content.startswith("```json"):
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif content.startswith("```"):
-                content = content.split("```")[1].split("```")[0].strip()
-
-            suggestion_data = json.loads(content)
+            block = response.content[0]
+            data = getattr(block, "input", None)
+            if not isinstance(data, dict):
+                data = _extract_json(block.text)
 
-            return [ContentSuggestion(
-                section=f"experience_{index}",
-                original_text=suggestion_data["original_text"],
-                suggested_text=suggestion_data["suggested_text"],
-                explanation=suggestion_data["explanation"],
-                impact=suggestion_data.get("impact", "high")
-            )]
+            suggestions = []
+            for item in data["suggestions"]:
+                idx = int(item["index"])
+                if 0 <= idx < len(experiences):
+                    suggestions.append(ContentSuggestion(
+                        section=f"experience_{idx}",
+                        original_text=item["original_text"],
+                        suggested_text=item["suggested_text"],
+                        explanation=item["explanation"],
+                        impact=item.get("impact", "high")
+                    ))
+
+            await _response_cache.set(cache_key, suggestions)
+            return suggestions
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Claude response for experience: {str(e)}")
-            return []
         except Exception as e:
-            logger.error(f"Error analyzing experience: {str(e)}", exc_info=True)
-            return []
-
-    async def _analyze_skills(self, skills: List[Any]) -> List[ContentSuggestion]:
-        """Analyze skills section and provide suggestions."""
-        if not skills:
-            return []
-
+            logger.warning(f"Fused experience analysis failed, falling back per entry: {e}")
+            results = await asyncio.gather(
+                *(self._analyze_experience(exp, idx) for idx, exp in indexed),
+                return_exceptions=True,
+            )
+            return list(chain.from_iterable(
+                result for result in results
+                if not isinstance(result, BaseException)
+            ))
+
+    @staticmethod
+    def _build_skills_prompt(skills: List[Any]) -> Optional[str]:
+        """Build the analysis prompt for a skills section (None if empty)."""
         # Format skills for analysis
         skills_text = []
         for skill_group in skills[:5]:  # Limit to first 5 skill groups
@@ -227,67 +750,23 @@ Important: Return ONLY the JSON object, no additional text."""
                 skills_text.append(f"{category}: {skill_list}")
 
         if not skills_text:
-            return []
-
-        skills_content = "\n".join(skills_text)
+            return None
 
-        if len(skills_content) > ClaudeConfig.MAX_TEXT_LENGTH:
-            skills_content = skills_content[:ClaudeConfig.MAX_TEXT_LENGTH]
+        skills_content = _truncate_to_tokens("\n".join(skills_text))
 
-        prompt = f"""Analyze this resume skills section and provide ONE specific improvement suggestion.
+        return f"Current Skills:\n{skills_content}"
 
-Current Skills:
-{skills_content}
-
-Focus on:
-1. Organization and categorization
-2. Relevance and priority (put most important skills first)
-3. Specificity (avoid vague terms)
-4. Industry-standard terminology
-5. Balance of technical and soft skills
-
-Return your response as a JSON object with this exact structure:
-{{
-  "original_text": "describe current organization/issue",
-  "suggested_text": "your specific recommendation",
-  "explanation": "brief explanation of the improvement",
-  "impact": "medium"
-}}
-
-Important: Return ONLY the JSON object, no additional text."""
-
-        try:
-            response = await self.client.messages.create(
-                model=ClaudeConfig.MODEL,
-                max_tokens=ClaudeConfig.MAX_TOKENS,
-                temperature=ClaudeConfig.TEMPERATURE,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            content = response.content[0].text.strip()
-            # Remove markdown code blocks if present
-            if content.startswith("```json"):
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif content.startswith("```"):
-                content = content.split("```")[1].split("```")[0].strip()
-
-            suggestion_data = json.loads(content)
-
-            return [ContentSuggestion(
-                section="skills",
-                original_text=suggestion_data["original_text"],
-                suggested_text=suggestion_data["suggested_text"],
-                explanation=suggestion_data["explanation"],
-                impact=suggestion_data.get("impact", "medium")
-            )]
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Claude response for skills: {str(e)}")
+    async def _analyze_skills(self, skills: List[Any]) -> List[ContentSuggestion]:
+        """Analyze skills section and provide suggestions."""
+        if not skills:
             return []
-        except Exception as e:
-            logger.error(f"Error analyzing skills: {str(e)}", exc_info=True)
+
+        prompt = self._build_skills_prompt(skills)
+        if prompt is None:
             return []
 
+        return await self._one_suggestion("skills", _SKILLS_SYSTEM, prompt, "medium")
+
     async def improve_summary(self, summary: str) -> str:
         """
         Improve professional summary.
@@ -306,33 +785,25 @@ Important: Return ONLY the JSON object, no additional text."""
             logger.warning("Summary too short or empty")
             return summary
 
-        if len(summary) > ClaudeConfig.MAX_TEXT_LENGTH:
-            summary = summary[:ClaudeConfig.MAX_TEXT_LENGTH]
+        summary = _truncate_to_tokens(summary)
 
-        prompt = f"""Improve this professional resume summary. Make it more impactful, concise, and achievement-focused.
-
-Current Summary:
-{summary}
-
-Requirements:
-1. Keep it 2-3 sentences (50-80 words)
-2. Start with your professional identity
-3. Include 1-2 key achievements with metrics if possible
-4. End with value proposition or career goals
-5. Use active voice and strong action verbs
-6. Make it compelling and specific
+        prompt = f"Current Summary:\n{summary}"
 
-Return ONLY the improved summary text, nothing else."""
+        cache_key = ClaudeResponseCache.make_key(prompt, _IMPROVE_SUMMARY_SYSTEM)
+        cached = await _response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Claude response cache hit for improve_summary")
+            return cached
 
         try:
-            response = await self.client.messages.create(
+            improved = (await self._stream_text_with_retry(
                 model=ClaudeConfig.MODEL,
-                max_tokens=500,
+                max_tokens=ClaudeConfig.SUMMARY_MAX_TOKENS,
                 temperature=ClaudeConfig.TEMPERATURE,
+                system=_IMPROVE_SUMMARY_SYSTEM,
                 messages=[{"role": "user", "content": prompt}]
-            )
-
-            improved = response.content[0].text.strip()
+            )).strip()
+            await _response_cache.set(cache_key, improved)
             logger.info("Successfully improved summary")
             return improved
 
@@ -361,51 +832,40 @@ Return ONLY the improved summary text, nothing else."""
         bullets_to_improve = bullets[:5]
         bullets_text = "\n".join(f"{i+1}. {bullet}" for i, bullet in enumerate(bullets_to_improve))
 
-        if len(bullets_text) > ClaudeConfig.MAX_TEXT_LENGTH:
-            bullets_text = bullets_text[:ClaudeConfig.MAX_TEXT_LENGTH]
+        bullets_text = _truncate_to_tokens(bullets_text)
 
-        prompt = f"""Improve these resume bullet points. Make them more impactful and achievement-focused.
+        prompt = f"Current Bullet Points:\n{bullets_text}"
 
-Current Bullet Points:
-{bullets_text}
-
-Requirements for each bullet:
-1. Start with a strong action verb (past tense for previous roles)
-2. Include specific metrics, percentages, or numbers
-3. Follow format: "Action Verb + Task + Result/Impact"
-4. Be concise (1-2 lines max)
-5. Focus on achievements and outcomes, not just responsibilities
-
-Return ONLY the improved bullet points as a numbered list (1., 2., 3., etc.), nothing else."""
+        # Cache only the improved prefix; trailing bullets beyond the first 5
+        # never reach the prompt so they are re-appended per call
+        cache_key = ClaudeResponseCache.make_key(prompt, _IMPROVE_BULLETS_SYSTEM)
+        cached = await _response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Claude response cache hit for improve_bullet_points")
+            return cached + bullets[len(bullets_to_improve):]
 
         try:
-            response = await self.client.messages.create(
+            improved_text = (await self._stream_text_with_retry(
                 model=ClaudeConfig.MODEL,
-                max_tokens=ClaudeConfig.MAX_TOKENS,
+                max_tokens=(len(bullets_to_improve)
+                            * ClaudeConfig.BULLETS_PER_ITEM_TOKENS + 128),
                 temperature=ClaudeConfig.TEMPERATURE,
+                system=_IMPROVE_BULLETS_SYSTEM,
                 messages=[{"role": "user", "content": prompt}]
-            )
-
-            improved_text = response.content[0].text.strip()
+            )).strip()
 
-            # Parse the numbered list
+            # Parse the numbered list: one regex scan per line removes the
+            # numbering or bullet marker and trims whitespace
             improved_bullets = []
-            for line in improved_text.split('\n'):
-                line = line.strip()
-                if line:
-                    # Remove numbering (1., 2., etc.) and bullet points (-, *, •)
-                    cleaned = line
-                    if line[0].isdigit() and '.' in line[:4]:
-                        cleaned = line.split('.', 1)[1].strip()
-                    elif line.startswith(('-', '*', '•')):
-                        cleaned = line[1:].strip()
-
-                    if cleaned:
-                        improved_bullets.append(cleaned)
+            for line in improved_text.splitlines():
+                m = _BULLET_RE.match(line)
+                if m:
+                    improved_bullets.append(m.group(1))
 
             # If we have improved bullets and they match the count, return them
             if improved_bullets and len(improved_bullets) == len(bullets_to_improve):
                 logger.info(f"Successfully improved {len(improved_bullets)} bullet points")
+                await _response_cache.set(cache_key, improved_bullets)
                 # If original had more bullets, append the remaining ones
                 return improved_bullets + bullets[len(bullets_to_improve):]
             else:
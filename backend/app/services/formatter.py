@@ -1,6 +1,6 @@
 """Document formatting service."""
 
-from pathlib import Path
+from typing import BinaryIO
 from app.models.resume import ResumeContent
 
 
@@ -8,33 +8,30 @@ class DocumentFormatter:
     """Document formatting service for generating standardized resumes."""
 
     @staticmethod
-    async def generate_pdf(resume_content: ResumeContent, output_path: str) -> str:
+    async def generate_pdf(resume_content: ResumeContent, buffer: BinaryIO) -> None:
         """
-        Generate PDF from resume content.
+        Generate PDF from resume content into an in-memory buffer.
+
+        Writing into a file-like object lets the export routes stream the
+        bytes directly without a disk round-trip.
 
         Args:
             resume_content: Parsed resume content
-            output_path: Path where PDF should be saved
-
-        Returns:
-            Path to generated PDF file
+            buffer: Binary file-like object to write the PDF into
         """
         # Placeholder implementation
         # TODO: Implement with reportlab or WeasyPrint
-        return output_path
+        pass
 
     @staticmethod
-    async def generate_docx(resume_content: ResumeContent, output_path: str) -> str:
+    async def generate_docx(resume_content: ResumeContent, buffer: BinaryIO) -> None:
         """
-        Generate DOCX from resume content.
+        Generate DOCX from resume content into an in-memory buffer.
 
         Args:
             resume_content: Parsed resume content
-            output_path: Path where DOCX should be saved
-
-        Returns:
-            Path to generated DOCX file
+            buffer: Binary file-like object to write the DOCX into
         """
         # Placeholder implementation
         # TODO: Implement with python-docx
-        return output_path
+        pass
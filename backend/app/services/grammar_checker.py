@@ -1,37 +1,86 @@
 """Grammar checking service using LanguageTool."""
 
+import asyncio
+import hashlib
 import logging
-from typing import List
+import threading
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 import language_tool_python
+from cachetools import LRUCache
 from app.models.analysis import GrammarIssue
 
 logger = logging.getLogger(__name__)
 
-# Global LanguageTool instance (initialized once for performance)
+# Global LanguageTool instance (initialized once for performance); the lock
+# keeps concurrent first calls from racing to spawn multiple JVM servers
 _language_tool = None
+_language_tool_lock = threading.Lock()
+
+# LanguageTool.check blocks on the JVM; running it here would stall the event
+# loop for the whole check. A small dedicated pool keeps the loop responsive
+# and lets several documents be checked concurrently (LT's Java server
+# handles concurrent check calls internally).
+_GRAMMAR_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="grammar")
+
+# Exact-match result cache: edit/save flows re-check identical sections, and
+# hashing the text is orders of magnitude cheaper than a round trip to the
+# LanguageTool server. Keyed by content digest plus the issue limit.
+_GRAMMAR_CACHE: LRUCache = LRUCache(maxsize=512)
 
 
 def get_language_tool():
     """Get or create LanguageTool instance (singleton pattern)."""
     global _language_tool
     if _language_tool is None:
-        try:
-            logger.info("Initializing LanguageTool...")
-            _language_tool = language_tool_python.LanguageTool('en-US')
-            logger.info("LanguageTool initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize LanguageTool: {e}")
-            raise
+        with _language_tool_lock:
+            if _language_tool is not None:  # Initialized while we waited
+                return _language_tool
+            try:
+                logger.info("Initializing LanguageTool...")
+                tool = language_tool_python.LanguageTool('en-US')
+                # Disable noisy categories server-side so the JVM never
+                # analyzes or serializes matches we would discard anyway
+                tool.disabled_categories = set(GrammarChecker.IGNORED_CATEGORIES)
+                _language_tool = tool
+                logger.info("LanguageTool initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize LanguageTool: {e}")
+                raise
     return _language_tool
 
 
+def _copy_issues(issues: List[GrammarIssue]) -> List[GrammarIssue]:
+    """Deep-copy a cached issue list before handing it to a caller.
+
+    The cached lists are pristine masters: the section paths relabel
+    category and rebase offset/line in place, so returning the cached
+    objects themselves would let one caller's edits leak into every
+    later cache hit.
+    """
+    return [issue.model_copy(deep=True) for issue in issues]
+
+
+@lru_cache(maxsize=4096)
+def _section_category(section: str, category: str) -> str:
+    """Cached "section: category" label.
+
+    Sections and LanguageTool categories both come from small fixed sets,
+    so the cache turns a per-issue f-string allocation into a dict hit.
+    """
+    return f"{section}: {category}" if category else section
+
+
 class GrammarChecker:
     """Grammar checking service using LanguageTool."""
 
     # Maximum text length to check (prevent performance issues)
     MAX_TEXT_LENGTH = 50000  # 50KB
 
-    # Categories to ignore (too noisy for resumes)
+    # Categories to ignore (too noisy for resumes); disabled at the
+    # LanguageTool server so matches are never produced
     IGNORED_CATEGORIES = {
         'TYPOGRAPHY',  # Resume formatting is intentional
         'CASING',  # Resume section headers often use specific casing
@@ -58,18 +107,38 @@ class GrammarChecker:
             logger.warning(f"Text truncated from {len(text)} to {GrammarChecker.MAX_TEXT_LENGTH} for grammar check")
             text = text[:GrammarChecker.MAX_TEXT_LENGTH]
 
+        cache_key = (hashlib.sha256(text.encode()).digest(), max_issues)
+        cached = _GRAMMAR_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("Grammar cache hit")
+            return _copy_issues(cached)
+
         try:
             tool = get_language_tool()
 
             logger.info(f"Checking grammar for {len(text)} characters")
-            matches = tool.check(text)
+            loop = asyncio.get_running_loop()
+            matches = await loop.run_in_executor(_GRAMMAR_POOL, tool.check, text)
             logger.info(f"Found {len(matches)} grammar issues")
 
-            issues = []
+            # Precompute newline offsets in a single C-level scan so each
+            # match maps offset->line in O(log n) instead of re-counting
+            # newlines over a text prefix per match (O(n * matches)).
+            newline_offsets = GrammarChecker._find_newline_offsets(text)
+
+            # Preallocate the bounded output buffer: the issue count is
+            # capped at max_issues anyway, so a fixed-size list avoids
+            # repeated append reallocations and iterating matches past
+            # the cap
+            issues: List[GrammarIssue] = [None] * min(max_issues, len(matches))
+            count = 0
             for match in matches:
-                # Skip ignored categories
-                if match.category in GrammarChecker.IGNORED_CATEGORIES:
-                    continue
+                if count >= max_issues:
+                    logger.info(f"Reached max issues limit ({max_issues}), stopping")
+                    break
+
+                # Ignored categories are disabled server-side in
+                # get_language_tool, so no post-hoc filter is needed here
 
                 # Extract suggestions (limit to top 3)
                 suggestions = match.replacements[:3] if match.replacements else []
@@ -77,10 +146,9 @@ class GrammarChecker:
                 # Calculate line number from offset
                 line_number = None
                 if match.offset is not None:
-                    # Count newlines up to the offset position
-                    line_number = text[:match.offset].count('\n') + 1
+                    line_number = bisect_left(newline_offsets, match.offset) + 1
 
-                issue = GrammarIssue(
+                issues[count] = GrammarIssue(
                     text=match.context,
                     message=match.message,
                     suggestions=suggestions,
@@ -88,21 +156,28 @@ class GrammarChecker:
                     line=line_number,
                     offset=match.offset
                 )
-                issues.append(issue)
-
-                # Limit total issues returned
-                if len(issues) >= max_issues:
-                    logger.info(f"Reached max issues limit ({max_issues}), stopping")
-                    break
+                count += 1
 
+            del issues[count:]
             logger.info(f"Returning {len(issues)} grammar issues after filtering")
-            return issues
+            _GRAMMAR_CACHE[cache_key] = issues
+            return _copy_issues(issues)
 
         except Exception as e:
             logger.exception(f"Error during grammar check: {e}")
             # Return empty list on error (graceful degradation)
             return []
 
+    @staticmethod
+    def _find_newline_offsets(text: str) -> List[int]:
+        """Find all newline offsets in text with str.find (C-level scan)."""
+        offsets = []
+        pos = text.find('\n')
+        while pos != -1:
+            offsets.append(pos)
+            pos = text.find('\n', pos + 1)
+        return offsets
+
     @staticmethod
     async def check_grammar_by_section(text: str, section_name: str = "full") -> List[GrammarIssue]:
         """
@@ -120,7 +195,53 @@ class GrammarChecker:
 
         # Add section context to each issue
         for issue in issues:
-            issue.category = f"{section_name}: {issue.category}" if issue.category else section_name
+            issue.category = _section_category(section_name, issue.category)
+
+        return issues
+
+    @staticmethod
+    async def check_all_sections(sections: Dict[str, str]) -> List[GrammarIssue]:
+        """
+        Check several sections in a single LanguageTool invocation.
+
+        Sections are joined with paragraph breaks and checked once, then
+        each issue is mapped back to its originating section through a
+        cumulative offset table — one JVM round-trip instead of one per
+        section.
+
+        Args:
+            sections: Mapping of section name to section text
+
+        Returns:
+            Combined list of grammar issues, section-labelled like
+            check_grammar_by_section and with offsets/lines local to
+            their section
+        """
+        if not sections:
+            return []
+
+        names = list(sections)
+        texts = [sections[name] for name in names]
+        sep = "\n\n"  # paragraph break stops sentences merging across sections
+        joined = sep.join(texts)
+
+        # Cumulative start offset (and preceding newline count) per section
+        starts = [0]
+        for text in texts[:-1]:
+            starts.append(starts[-1] + len(text) + len(sep))
+        newlines_before = [joined.count("\n", 0, start) for start in starts]
+
+        issues = await GrammarChecker.check_grammar(joined)
+
+        for issue in issues:
+            if issue.offset is None:
+                continue
+            idx = bisect_right(starts, issue.offset) - 1
+            name = names[idx]
+            issue.offset -= starts[idx]
+            if issue.line is not None:
+                issue.line -= newlines_before[idx]
+            issue.category = _section_category(name, issue.category)
 
         return issues
 
@@ -1,13 +1,22 @@
 """Document parsing service with security hardening."""
 
+import asyncio
 import logging
 import re
-import regex  # For timeout support
+import threading
+import zipfile
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple
 
+import anyio
 import pdfplumber
-from docx import Document
+import xxhash
+from cachetools import LRUCache
+import pypdfium2 as pdfium
+from lxml import etree
 from email_validator import validate_email, EmailNotValidError
 
 from app.models.resume import (
@@ -23,6 +32,76 @@ from app.services.parser_config import ParserConfig
 logger = logging.getLogger(__name__)
 
 
+# Deletion table for non-printable characters: str.translate strips them in
+# one C-level pass with no per-match Python callback, and unlike a bytes
+# round-trip it leaves non-ASCII resume text (accented names etc.) intact.
+# Beyond the C0/C1 control ranges this covers the Unicode format and
+# separator characters the original isprintable() filter removed and that
+# word processors commonly leave behind: soft hyphen, zero-width characters,
+# bidi marks and controls, line/paragraph separators, word joiner, and BOM.
+_CTRL_DELETE = {
+    c: None
+    for c in [
+        *range(0x00, 0x09), *range(0x0B, 0x20), *range(0x7F, 0xA0),
+        0x00AD,                  # soft hyphen
+        *range(0x200B, 0x2010),  # zero-width chars, joiners, bidi marks
+        0x2028, 0x2029,          # line / paragraph separators
+        *range(0x202A, 0x202F),  # bidi embedding controls
+        0x2060,                  # word joiner
+        *range(0x2066, 0x206A),  # bidi isolate controls
+        0xFEFF,                  # BOM / zero-width no-break space
+    ]
+}
+
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
+# Dirty-input probe covering both sanitize passes: most extractor output is
+# already clean, and a single failed search is far cheaper than rebuilding
+# the string through translate + sub. The character class is generated from
+# _CTRL_DELETE so the two can never drift apart.
+_SANITIZE_PROBE = re.compile(
+    '[' + re.escape(''.join(map(chr, _CTRL_DELETE))) + ']|\n{3}'
+)
+
+
+# Deletion table keeping only digits and '+': one C-level pass replaces the
+# per-character comprehension in phone normalization
+_PHONE_DELETE = {c: None for c in range(256) if chr(c) not in '0123456789+'}
+
+# C-level digit probe for the name heuristic
+_HAS_DIGIT = re.compile(r'\d')
+
+# Memoized parse results keyed by (content digest, file type). Uploads land
+# under fresh uuid4 filenames, so the file path must stay out of the key for
+# re-uploads to ever hit. The lock guards the LRU's internal reordering:
+# _parse_bytes runs on worker threads.
+_PARSE_CACHE: LRUCache = LRUCache(maxsize=ParserConfig.PARSE_CACHE_SIZE)
+_parse_cache_lock = threading.Lock()
+
+
+class HeaderScan(NamedTuple):
+    """Header-scan results as parallel arrays, in document order.
+
+    Structure-of-arrays layout: each extractor walks one small list for
+    its section type instead of unpacking a dict per header. Entries
+    marked strict sit on their own line and are safe to slice section
+    content from; loose entries (inline content after the label, e.g.
+    "Skills: Python, Java") still count for section identification.
+    """
+
+    sections: List[str]
+    headers: List[str]
+    positions: List[int]
+    content_starts: List[int]
+    strict: List[bool]
+
+# WordprocessingML element tags for direct DOCX parsing
+_DOCX_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_DOCX_P = f'{{{_DOCX_NS}}}p'
+_DOCX_T = f'{{{_DOCX_NS}}}t'
+
+
+
 class ParsingError(Exception):
     """Custom exception for parsing errors."""
     pass
@@ -49,15 +128,131 @@ class DocumentParser:
         """
         logger.info(f"Starting parse for file: {file_path}, type: {file_type}")
 
-        if file_type == "pdf":
-            return DocumentParser.parse_pdf(file_path)
-        elif file_type == "docx":
-            return DocumentParser.parse_docx(file_path)
-        else:
+        if file_type not in ("pdf", "docx"):
+            error_msg = f"Unsupported file type: {file_type}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        # Re-uploads and retry flows resubmit identical files; a full
+        # content hash keys a memoized parse so repeats skip extraction
+        # entirely. Uploads are capped at MAX_FILE_SIZE, so xxh64 over the
+        # whole file costs low single-digit milliseconds at worst — a
+        # prefix hash would collide for files sharing their first bytes
+        # (e.g. incrementally-saved PDF revisions, which only append)
+        try:
+            with open(file_path, 'rb') as f:
+                digest = xxhash.xxh64(f.read()).hexdigest()
+        except OSError:
+            # Unreadable file: let the type-specific parser produce its
+            # usual error result without poisoning the cache
+            return DocumentParser._parse_by_type(file_path, file_type)
+
+        key = (digest, file_type)
+        with _parse_cache_lock:
+            cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            logger.debug(f"Parse cache hit for {file_path}")
+            return cached
+
+        content = DocumentParser._parse_by_type(file_path, file_type)
+        with _parse_cache_lock:
+            _PARSE_CACHE[key] = content
+        return content
+
+    @staticmethod
+    def parse_many(items: List[Tuple[str, str]]) -> List[ResumeContent]:
+        """
+        Parse a batch of documents in worker processes.
+
+        Parsing is CPU-bound and stateless, so batch ingestion fans out to
+        a process pool instead of serializing behind the GIL.
+
+        Args:
+            items: List of (file_path, file_type) pairs
+
+        Returns:
+            ResumeContent objects in the same order as items
+        """
+        if len(items) <= 1:
+            return [_parse_one(item) for item in items]
+
+        workers = min(len(items), ParserConfig.PARSE_PROCESS_WORKERS)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_parse_one, items))
+
+    @staticmethod
+    async def parse_async(file_path: str, file_type: str) -> ResumeContent:
+        """
+        Parse a document without blocking the event loop.
+
+        The file is read asynchronously so the event loop keeps servicing
+        requests during disk I/O, then the CPU-bound parse runs on a worker
+        thread against the in-memory bytes.
+
+        Args:
+            file_path: Path to document file
+            file_type: File type (pdf or docx)
+
+        Returns:
+            ResumeContent object with extracted data
+
+        Raises:
+            ValueError: If file type is not supported
+        """
+        logger.info(f"Starting async parse for file: {file_path}, type: {file_type}")
+
+        if file_type not in ("pdf", "docx"):
             error_msg = f"Unsupported file type: {file_type}"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
+        try:
+            data = await anyio.Path(file_path).read_bytes()
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}", exc_info=True)
+            return ResumeContent(raw_text="File not found")
+        except PermissionError:
+            logger.error(f"Permission denied reading file: {file_path}", exc_info=True)
+            return ResumeContent(raw_text="Permission denied")
+
+        return await asyncio.to_thread(
+            DocumentParser._parse_bytes, data, file_type, file_path
+        )
+
+    @staticmethod
+    def _parse_bytes(data: bytes, file_type: str, file_path: str = "") -> ResumeContent:
+        """Parse document bytes already read into memory."""
+        digest = xxhash.xxh64(data).hexdigest()
+        key = (digest, file_type)
+        with _parse_cache_lock:
+            cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            logger.debug(f"Parse cache hit for {file_path}")
+            return cached
+
+        try:
+            source = BytesIO(data)
+            if file_type == "pdf":
+                raw_text = DocumentParser._extract_text_from_pdf(source)
+            else:
+                raw_text = DocumentParser._extract_text_from_docx(source)
+            content = DocumentParser._parse_document_text(raw_text, file_path)
+
+        except Exception:
+            logger.exception(f"Unexpected error parsing document: {file_path}")
+            return ResumeContent(raw_text=f"Unable to process {file_type.upper()} file")
+
+        with _parse_cache_lock:
+            _PARSE_CACHE[key] = content
+        return content
+
+    @staticmethod
+    def _parse_by_type(file_path: str, file_type: str) -> ResumeContent:
+        """Dispatch to the type-specific parser."""
+        if file_type == "pdf":
+            return DocumentParser.parse_pdf(file_path)
+        return DocumentParser.parse_docx(file_path)
+
     @staticmethod
     def parse_pdf(file_path: str) -> ResumeContent:
         """
@@ -115,50 +310,113 @@ class DocumentParser:
             return ResumeContent(raw_text="Unable to process DOCX file")
 
     @staticmethod
-    def _extract_text_from_pdf(file_path: str) -> str:
-        """Extract raw text from PDF file."""
-        raw_text = ""
-        with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                page_text = page.extract_text()
+    def _extract_text_from_pdf(source) -> str:
+        """Extract raw text from a PDF path or binary buffer.
+
+        PDFium's C++ text extraction is used first — we only need linear
+        text for regex extraction, not pdfminer's layout reconstruction.
+        pdfplumber remains as the fallback for documents PDFium rejects.
+        """
+        try:
+            return DocumentParser._extract_text_with_pdfium(source)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.warning(f"PDFium extraction failed, falling back to pdfplumber: {e}")
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            return DocumentParser._extract_text_with_pdfplumber(source)
+
+    @staticmethod
+    def _extract_text_with_pdfium(source) -> str:
+        """Extract linear text via PDFium."""
+        chunks = []
+        total = 0
+        pdf = pdfium.PdfDocument(source)
+        try:
+            for page_num in range(len(pdf)):
+                textpage = pdf[page_num].get_textpage()
+                try:
+                    page_text = textpage.get_text_range()
+                finally:
+                    textpage.close()
                 if page_text:
-                    raw_text += page_text + "\n"
+                    chunks.append(page_text)
+                    chunks.append("\n")
+                    total += len(page_text) + 1
 
                 # Prevent memory exhaustion
-                if len(raw_text) > ParserConfig.MAX_RAW_TEXT_LENGTH:
-                    logger.warning(f"PDF text exceeds max length, truncating at page {page_num}")
-                    raw_text = raw_text[:ParserConfig.MAX_RAW_TEXT_LENGTH]
+                if total > ParserConfig.MAX_RAW_TEXT_LENGTH:
+                    logger.warning(f"PDF text exceeds max length, truncating at page {page_num + 1}")
                     break
+        finally:
+            pdf.close()
 
-        return raw_text
+        return "".join(chunks)[:ParserConfig.MAX_RAW_TEXT_LENGTH]
 
     @staticmethod
-    def _extract_text_from_docx(file_path: str) -> str:
-        """Extract raw text from DOCX file."""
-        doc = Document(file_path)
-        raw_text = ""
+    def _extract_text_with_pdfplumber(source) -> str:
+        """Extract text via pdfplumber (layout-aware, slower)."""
+        # Accumulate chunks and join once: += on a growing string is
+        # quadratic, and the length check only needs a running counter
+        chunks = []
+        total = 0
+        with pdfplumber.open(source) as pdf:
+            pages = pdf.pages
+            # pdfminer releases the GIL during decompression and layout
+            # analysis, so pages decode concurrently; executor.map keeps
+            # results in page order. extract_text_simple skips the
+            # word-clustering layout pass — resumes only need reading
+            # order, not column reconstruction
+            workers = min(ParserConfig.PDF_PARSE_WORKERS, len(pages)) or 1
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                page_texts = executor.map(
+                    lambda page: page.extract_text_simple(
+                        x_tolerance=ParserConfig.PDF_X_TOLERANCE,
+                        y_tolerance=ParserConfig.PDF_Y_TOLERANCE,
+                    ) or "",
+                    pages,
+                )
+                for page_num, page_text in enumerate(page_texts, start=1):
+                    if page_text:
+                        chunks.append(page_text)
+                        chunks.append("\n")
+                        total += len(page_text) + 1
 
-        # Extract text from paragraphs
-        for paragraph in doc.paragraphs:
-            raw_text += paragraph.text + "\n"
+                    # Prevent memory exhaustion
+                    if total > ParserConfig.MAX_RAW_TEXT_LENGTH:
+                        logger.warning(f"PDF text exceeds max length, truncating at page {page_num}")
+                        break
 
-            # Prevent memory exhaustion
-            if len(raw_text) > ParserConfig.MAX_RAW_TEXT_LENGTH:
-                logger.warning("DOCX text exceeds max length, truncating")
-                return raw_text[:ParserConfig.MAX_RAW_TEXT_LENGTH]
+        return "".join(chunks)[:ParserConfig.MAX_RAW_TEXT_LENGTH]
 
-        # Extract text from tables (resumes often use tables)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    raw_text += cell.text + "\n"
+    @staticmethod
+    def _extract_text_from_docx(source) -> str:
+        """Extract raw text from a DOCX path or binary buffer.
 
-                    # Prevent memory exhaustion
-                    if len(raw_text) > ParserConfig.MAX_RAW_TEXT_LENGTH:
-                        logger.warning("DOCX text exceeds max length, truncating")
-                        return raw_text[:ParserConfig.MAX_RAW_TEXT_LENGTH]
+        Reads word/document.xml directly instead of walking python-docx's
+        paragraph/table object model, which builds a wrapper object per
+        element. Table cell text lives in w:p elements too, so one pass
+        over paragraphs covers paragraphs and tables in document order.
+        """
+        with zipfile.ZipFile(source) as archive:
+            document_xml = archive.read('word/document.xml')
+
+        chunks = []
+        total = 0
+        for _, paragraph in etree.iterparse(BytesIO(document_xml), tag=_DOCX_P):
+            paragraph_text = ''.join(t.text or '' for t in paragraph.iter(_DOCX_T))
+            chunks.append(paragraph_text)
+            chunks.append("\n")
+            total += len(paragraph_text) + 1
+            paragraph.clear()
 
-        return raw_text
+            # Prevent memory exhaustion
+            if total > ParserConfig.MAX_RAW_TEXT_LENGTH:
+                logger.warning("DOCX text exceeds max length, truncating")
+                break
+
+        return "".join(chunks)[:ParserConfig.MAX_RAW_TEXT_LENGTH]
 
     @staticmethod
     def _parse_document_text(raw_text: str, file_path: str = "") -> ResumeContent:
@@ -180,43 +438,66 @@ class DocumentParser:
         raw_text = DocumentParser._sanitize_text(raw_text)
 
         try:
+            # One newline-offset table and one header scan shared by every
+            # extractor
+            newlines = DocumentParser._newline_positions(raw_text)
+            headers = DocumentParser._scan_headers(raw_text, newlines)
+
             # Extract all components
-            contact_info = DocumentParser._extract_contact_info(raw_text)
-            summary = DocumentParser._extract_summary(raw_text)
-            experience = DocumentParser._extract_experience(raw_text)
-            education = DocumentParser._extract_education(raw_text)
-            skills = DocumentParser._extract_skills(raw_text)
-            sections = DocumentParser._identify_sections(raw_text)
+            contact_info = DocumentParser._extract_contact_info(raw_text, newlines)
+            summary = DocumentParser._extract_summary(raw_text, headers)
+            experience = DocumentParser._extract_experience(raw_text, headers)
+            education = DocumentParser._extract_education(raw_text, headers)
+            skills = DocumentParser._extract_skills(raw_text, headers)
+            sections = DocumentParser._identify_sections(raw_text, headers)
 
             logger.info(f"Successfully parsed document: {len(experience)} experiences, "
                        f"{len(education)} education entries, {len(skills)} skill groups")
 
-            return ResumeContent(
+            # model_construct skips field validation: every value here was
+            # produced (and bounded) by the extractors above, so the parse
+            # hot path pays no per-model validator cost. The API layer
+            # still validates inbound payloads normally.
+            content = ResumeContent.model_construct(
                 contact_info=contact_info,
                 summary=summary,
                 experience=experience,
                 education=education,
                 skills=skills,
                 raw_text=raw_text,
+                raw_text_len=len(raw_text),
                 sections=sections
             )
 
+            # Warm the flattened views once at parse time so analysis-time
+            # consumers share the precomputed lists
+            content.get_flat_bullets()
+            content.get_keyword_set()
+            content.get_total_skills()
+            content.get_section_mask()
+
+            return content
+
         except Exception as e:
             logger.exception(f"Error during document parsing for {file_path}")
             # Return partial results with error in sections
             return ResumeContent(
                 raw_text=raw_text,
+                raw_text_len=len(raw_text),
                 sections={"error": "Partial parsing failure"}
             )
 
     @staticmethod
     def _sanitize_text(text: str) -> str:
         """Sanitize extracted text."""
-        # Remove null bytes and control characters (except newlines and tabs)
-        text = ''.join(char for char in text if char.isprintable() or char in '\n\t')
-
-        # Normalize whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 consecutive newlines
+        # Fast path: clean text (the common case) skips both rewrite
+        # passes after one probe scan
+        if _SANITIZE_PROBE.search(text) is not None:
+            # Strip control characters with a translate table, then cap
+            # consecutive newlines at two with a literal-replacement sub:
+            # both passes run entirely in C
+            text = text.translate(_CTRL_DELETE)
+            text = _MULTI_NEWLINE_RE.sub('\n\n', text)
 
         # Limit total length
         if len(text) > ParserConfig.MAX_RAW_TEXT_LENGTH:
@@ -226,16 +507,36 @@ class DocumentParser:
         return text
 
     @staticmethod
-    def _extract_contact_info(text: str) -> Optional[ContactInfo]:
+    def _extract_contact_info(
+        text: str, newlines: Optional[List[int]] = None
+    ) -> Optional[ContactInfo]:
         """Extract and validate contact information from text."""
-        # Use only first portion for contact info (usually at top)
-        search_text = text[:ParserConfig.MAX_TEXT_FOR_CONTACT_EXTRACTION]
+        # Search only the first portion (contact info sits at the top);
+        # pos/endpos bound the scans without copying a 10KB slice
+        search_limit = min(len(text), ParserConfig.MAX_TEXT_FOR_CONTACT_EXTRACTION)
+        if newlines is None:
+            newlines = DocumentParser._newline_positions(text[:search_limit])
 
-        contact = ContactInfo()
+        contact = ContactInfo.model_construct()
 
         try:
+            # One fused pass over the contact window: the alternation
+            # reports email/LinkedIn/phone hits in document order and we
+            # keep the first of each kind, stopping once all are found
+            email_match = phone_match = linkedin_match = None
+            for match in ParserConfig.COMPILED_CONTACT.finditer(
+                    text, 0, search_limit):
+                kind = match.lastgroup
+                if kind == 'email':
+                    email_match = email_match or match
+                elif kind == 'phone':
+                    phone_match = phone_match or match
+                elif kind == 'linkedin':
+                    linkedin_match = linkedin_match or match
+                if email_match and phone_match and linkedin_match:
+                    break
+
             # Extract and validate email
-            email_match = re.search(ParserConfig.EMAIL_PATTERN, search_text)
             if email_match:
                 try:
                     valid = validate_email(email_match.group(0), check_deliverability=False)
@@ -245,13 +546,11 @@ class DocumentParser:
                     logger.debug(f"Invalid email found: {email_match.group(0)}")
 
             # Extract phone number
-            phone_match = re.search(ParserConfig.PHONE_PATTERN, search_text)
             if phone_match:
                 contact.phone = DocumentParser._normalize_phone(phone_match.group(0))
                 logger.debug(f"Extracted phone: {contact.phone}")
 
             # Extract LinkedIn URL
-            linkedin_match = re.search(ParserConfig.LINKEDIN_PATTERN, search_text, re.IGNORECASE)
             if linkedin_match:
                 linkedin_url = linkedin_match.group(0)
                 if not linkedin_url.startswith('http'):
@@ -260,82 +559,155 @@ class DocumentParser:
                 logger.debug(f"Extracted LinkedIn: {contact.linkedin}")
 
             # Extract name (heuristic: first non-empty line that's not too long)
-            lines = [line.strip() for line in search_text.split('\n') if line.strip()]
-            for line in lines[:5]:  # Check first 5 lines
+            # Lines materialize lazily from the precomputed newline offsets
+            # and the walk stops at the first qualifying line, so nothing
+            # past the hit is ever sliced
+            checked = 0
+            for line in DocumentParser._iter_first_lines(text, newlines, search_limit):
+                if not line:
+                    continue
+                checked += 1
                 # Skip lines that look like section headers or emails
                 if (len(line) < 50 and
                     not line.isupper() and
                     '@' not in line and
-                    not any(char.isdigit() for char in line)):
+                    not _HAS_DIGIT.search(line)):
                     contact.name = line
                     logger.debug(f"Extracted name: {contact.name}")
                     break
+                if checked >= 5:  # Check first 5 lines
+                    break
 
         except Exception as e:
             logger.warning(f"Error extracting contact info: {e}")
 
         return contact if any([contact.email, contact.phone, contact.name]) else None
 
+    @staticmethod
+    def _iter_first_lines(text, newlines, limit, max_newlines=20):
+        """Yield stripped lines from the top of text without a full split."""
+        start = 0
+        for pos in newlines[:max_newlines]:
+            if pos > limit:
+                return
+            yield text[start:pos].strip()
+            start = pos + 1
+        yield text[start:limit].strip()
+
     @staticmethod
     def _normalize_phone(phone: str) -> str:
         """Normalize phone number format."""
         # Remove all non-digit characters except +
-        digits = ''.join(c for c in phone if c.isdigit() or c == '+')
-        return digits
+        return phone.translate(_PHONE_DELETE)
+
+    @staticmethod
+    def _newline_positions(text: str) -> List[int]:
+        """Collect every newline offset in one pass.
+
+        Shared by the header scan and name extraction so "is position P a
+        line start?" and "give me the first lines" never re-walk the text.
+        """
+        positions = []
+        pos = text.find('\n')
+        while pos != -1:
+            positions.append(pos)
+            pos = text.find('\n', pos + 1)
+        return positions
+
+    @staticmethod
+    def _scan_headers(
+        text: str, newlines: Optional[List[int]] = None
+    ) -> HeaderScan:
+        """Locate every section header in one linear pass.
+
+        Returns parallel arrays, in document order, of the section type,
+        matched header text, the header's position, and the offset where
+        the section's content starts.
+        """
+        found = HeaderScan([], [], [], [], [])
+        lower = text.lower()
+        length = len(lower)
+        if newlines is None:
+            newlines = DocumentParser._newline_positions(text)
+        for end, (section, header) in ParserConfig.HEADER_AUTOMATON.iter(lower):
+            start = end - len(header) + 1
+
+            # The header must start its line: nothing but whitespace
+            # between the previous newline and the match
+            prev = bisect_left(newlines, start) - 1
+            line_start = newlines[prev] + 1 if prev >= 0 else 0
+            if lower[line_start:start].strip():
+                continue
+
+            # Whole word only: "skills" must not fire inside "skillset"
+            if end + 1 < length and lower[end + 1].isalnum():
+                continue
+
+            # Skip an optional colon/dash after the label
+            pos = end + 1
+            while pos < length and lower[pos] in ' \t':
+                pos += 1
+            if pos < length and lower[pos] in ':-':
+                pos += 1
+                while pos < length and lower[pos] in ' \t':
+                    pos += 1
+
+            # On its own line (or at EOF): strict, content starts on the
+            # next line. Otherwise content follows inline; record the
+            # header anyway so section identification keeps matching the
+            # "Skills: Python, Java" style, but extractors only slice
+            # from strict entries
+            strict = pos >= length or lower[pos] == '\n'
+
+            found.sections.append(section)
+            found.headers.append(text[start:end + 1])
+            found.positions.append(start)
+            found.content_starts.append(pos + 1 if strict else pos)
+            found.strict.append(strict)
+        return found
+
+    @staticmethod
+    def _section_span(
+        headers: HeaderScan, section: str, text_len: int
+    ) -> Optional[Tuple[int, int]]:
+        """Content span of a section's first occurrence, if present.
+
+        Content runs from just past the header line to the next strict
+        header's position (any section type), or to the end of the text.
+        Only strict (own-line) headers participate: a loose inline header
+        is a section signal, not a reliable slice boundary. Shared by
+        every extractor so the find-header/find-next/slice logic lives in
+        one place.
+        """
+        for i, found in enumerate(headers.sections):
+            if found == section and headers.strict[i]:
+                start = headers.content_starts[i]
+                end = text_len
+                for j in range(i + 1, len(headers.positions)):
+                    if headers.strict[j]:
+                        end = headers.positions[j]
+                        break
+                return start, end
+        return None
 
     @staticmethod
-    def _extract_summary(text: str) -> Optional[str]:
+    def _extract_summary(text: str, headers: Optional[HeaderScan] = None) -> Optional[str]:
         """Extract professional summary from text."""
         try:
-            for header in ParserConfig.SECTION_HEADERS['summary']:
-                # Simplified pattern to reduce ReDoS risk
-                # Allow optional whitespace after newline to handle indented text
-                pattern = rf'(?:^|\n)\s*({re.escape(header)})\s*[:\-]?\s*\n'
+            if headers is None:
+                headers = DocumentParser._scan_headers(text)
 
-                try:
-                    # Use regex library with timeout
-                    match = regex.search(
-                        pattern,
-                        text,
-                        flags=regex.IGNORECASE,
-                        timeout=ParserConfig.REGEX_TIMEOUT
-                    )
+            span = DocumentParser._section_span(headers, 'summary', len(text))
+            if span is None:
+                return None
 
-                    if match:
-                        # Extract text after header until next section
-                        start = match.end()
-                        # Look for next section header
-                        next_section = len(text)
-                        for section_headers in ParserConfig.SECTION_HEADERS.values():
-                            for next_header in section_headers:
-                                # Allow optional whitespace before header
-                                next_pattern = rf'\n\s*{re.escape(next_header)}\s*[:\-]?\s*\n'
-                                try:
-                                    next_match = regex.search(
-                                        next_pattern,
-                                        text[start:start+2000],  # Limit search
-                                        flags=regex.IGNORECASE,
-                                        timeout=ParserConfig.REGEX_TIMEOUT
-                                    )
-                                    if next_match:
-                                        potential_end = start + next_match.start()
-                                        next_section = min(next_section, potential_end)
-                                except TimeoutError:
-                                    logger.warning("Regex timeout finding next section")
-
-                        summary_text = text[start:next_section].strip()
-
-                        # Clean up and validate
-                        summary_text = ' '.join(summary_text.split())
-
-                        if len(summary_text) >= ParserConfig.MIN_SUMMARY_LENGTH:
-                            summary = summary_text[:ParserConfig.MAX_SUMMARY_LENGTH]
-                            logger.debug(f"Extracted summary: {len(summary)} chars")
-                            return summary
-
-                except TimeoutError:
-                    logger.warning(f"Regex timeout on summary pattern for header: {header}")
-                    continue
+            # Clean up and validate
+            summary_text = ' '.join(text[span[0]:span[1]].split())
+
+            if len(summary_text) >= ParserConfig.MIN_SUMMARY_LENGTH:
+                summary = summary_text[:ParserConfig.MAX_SUMMARY_LENGTH]
+                logger.debug(f"Extracted summary: {len(summary)} chars")
+                return summary
 
         except Exception as e:
             logger.warning(f"Error extracting summary: {e}")
@@ -343,62 +715,31 @@ class DocumentParser:
         return None
 
     @staticmethod
-    def _extract_experience(text: str) -> List[Experience]:
+    def _extract_experience(text: str, headers: Optional[HeaderScan] = None) -> List[Experience]:
         """Extract work experience from text."""
         experiences = []
 
         try:
-            for header in ParserConfig.SECTION_HEADERS['experience']:
-                pattern = rf'(?:^|\n)({re.escape(header)})\s*[:\-]?\s*\n'
-
-                try:
-                    match = regex.search(
-                        pattern,
-                        text,
-                        flags=regex.IGNORECASE,
-                        timeout=ParserConfig.REGEX_TIMEOUT
+            if headers is None:
+                headers = DocumentParser._scan_headers(text)
+
+            span = DocumentParser._section_span(headers, 'experience', len(text))
+            if span is not None:
+                experience_text = text[span[0]:span[1]].strip()
+
+                if experience_text:
+                    # For now, create single entry with full text
+                    # TODO: Enhance to split into individual job entries
+                    description = experience_text[:ParserConfig.MAX_EXPERIENCE_DESCRIPTION_LENGTH]
+
+                    exp = Experience.model_construct(
+                        company="Multiple positions listed",
+                        position="See description",
+                        description=description,
+                        bullets=[]
                     )
-
-                    if match:
-                        start = match.end()
-
-                        # Find end of experience section
-                        end = len(text)
-                        for next_header in (ParserConfig.SECTION_HEADERS['education'] +
-                                          ParserConfig.SECTION_HEADERS['skills']):
-                            next_pattern = rf'\n{re.escape(next_header)}\s*[:\-]?\s*\n'
-                            try:
-                                next_match = regex.search(
-                                    next_pattern,
-                                    text[start:start+5000],
-                                    flags=regex.IGNORECASE,
-                                    timeout=ParserConfig.REGEX_TIMEOUT
-                                )
-                                if next_match:
-                                    potential_end = start + next_match.start()
-                                    end = min(end, potential_end)
-                            except TimeoutError:
-                                pass
-
-                        experience_text = text[start:end].strip()
-
-                        if experience_text:
-                            # For now, create single entry with full text
-                            # TODO: Enhance to split into individual job entries
-                            description = experience_text[:ParserConfig.MAX_EXPERIENCE_DESCRIPTION_LENGTH]
-
-                            exp = Experience(
-                                company="Multiple positions listed",
-                                position="See description",
-                                description=description,
-                                bullets=[]
-                            )
-                            experiences.append(exp)
-                            logger.debug("Extracted experience section")
-                        break
-
-                except TimeoutError:
-                    logger.warning(f"Regex timeout extracting experience for header: {header}")
+                    experiences.append(exp)
+                    logger.debug("Extracted experience section")
 
         except Exception as e:
             logger.warning(f"Error extracting experience: {e}")
@@ -406,82 +747,54 @@ class DocumentParser:
         return experiences[:ParserConfig.MAX_EXPERIENCE_ENTRIES]
 
     @staticmethod
-    def _extract_education(text: str) -> List[Education]:
+    def _extract_education(text: str, headers: Optional[HeaderScan] = None) -> List[Education]:
         """Extract education from text."""
         education_list = []
 
         try:
-            for header in ParserConfig.SECTION_HEADERS['education']:
-                pattern = rf'(?:^|\n)({re.escape(header)})\s*[:\-]?\s*\n'
+            if headers is None:
+                headers = DocumentParser._scan_headers(text)
 
-                try:
-                    match = regex.search(
-                        pattern,
-                        text,
-                        flags=regex.IGNORECASE,
-                        timeout=ParserConfig.REGEX_TIMEOUT
-                    )
+            span = DocumentParser._section_span(headers, 'education', len(text))
+            if span is not None:
+                start, end = span
+
+                # Look for degree patterns; pos/endpos window the section
+                # without allocating a slice of it
+                for degree_pattern in ParserConfig.COMPILED_DEGREE:
+                    try:
+                        matches = degree_pattern.finditer(
+                            text, pos=start, endpos=end,
+                            timeout=ParserConfig.REGEX_TIMEOUT
+                        )
+                        for match in matches:
+                            institution_text = match.group(0).strip()
+                            institution_text = institution_text[:ParserConfig.MAX_EDUCATION_INSTITUTION_LENGTH]
 
-                    if match:
-                        start = match.end()
-
-                        # Find end of education section
-                        end = len(text)
-                        for next_header in ParserConfig.SECTION_HEADERS['skills']:
-                            next_pattern = rf'\n{re.escape(next_header)}\s*[:\-]?\s*\n'
-                            try:
-                                next_match = regex.search(
-                                    next_pattern,
-                                    text[start:start+3000],
-                                    flags=regex.IGNORECASE,
-                                    timeout=ParserConfig.REGEX_TIMEOUT
-                                )
-                                if next_match:
-                                    end = start + next_match.start()
-                            except TimeoutError:
-                                pass
-
-                        education_text = text[start:end].strip()
-
-                        # Look for degree patterns
-                        for pattern in ParserConfig.DEGREE_PATTERNS:
-                            try:
-                                matches = regex.finditer(
-                                    pattern,
-                                    education_text,
-                                    flags=regex.IGNORECASE,
-                                    timeout=ParserConfig.REGEX_TIMEOUT
-                                )
-                                for match in matches:
-                                    institution_text = match.group(0).strip()
-                                    institution_text = institution_text[:ParserConfig.MAX_EDUCATION_INSTITUTION_LENGTH]
-
-                                    edu = Education(
-                                        institution=institution_text,
-                                        degree="",
-                                        achievements=[]
-                                    )
-                                    education_list.append(edu)
-
-                                    if len(education_list) >= ParserConfig.MAX_EDUCATION_ENTRIES:
-                                        break
-                            except TimeoutError:
-                                logger.warning("Regex timeout in education pattern matching")
-
-                        # If no matches, create generic entry
-                        if not education_list and education_text:
-                            edu = Education(
-                                institution=education_text[:ParserConfig.MAX_EDUCATION_INSTITUTION_LENGTH],
+                            edu = Education.model_construct(
+                                institution=institution_text,
                                 degree="",
                                 achievements=[]
                             )
                             education_list.append(edu)
 
-                        logger.debug(f"Extracted {len(education_list)} education entries")
-                        break
+                            if len(education_list) >= ParserConfig.MAX_EDUCATION_ENTRIES:
+                                break
+                    except TimeoutError:
+                        logger.warning("Regex timeout in education pattern matching")
+
+                # If no matches, create generic entry
+                if not education_list:
+                    education_text = text[start:end].strip()
+                if not education_list and education_text:
+                    edu = Education.model_construct(
+                        institution=education_text[:ParserConfig.MAX_EDUCATION_INSTITUTION_LENGTH],
+                        degree="",
+                        achievements=[]
+                    )
+                    education_list.append(edu)
 
-                except TimeoutError:
-                    logger.warning(f"Regex timeout extracting education for header: {header}")
+                logger.debug(f"Extracted {len(education_list)} education entries")
 
         except Exception as e:
             logger.warning(f"Error extracting education: {e}")
@@ -489,45 +802,34 @@ class DocumentParser:
         return education_list[:ParserConfig.MAX_EDUCATION_ENTRIES]
 
     @staticmethod
-    def _extract_skills(text: str) -> List[Skill]:
+    def _extract_skills(text: str, headers: Optional[HeaderScan] = None) -> List[Skill]:
         """Extract skills from text."""
         skills_list = []
 
         try:
-            for header in ParserConfig.SECTION_HEADERS['skills']:
-                pattern = rf'(?:^|\n)({re.escape(header)})\s*[:\-]?\s*\n'
-
-                try:
-                    match = regex.search(
-                        pattern,
-                        text,
-                        flags=regex.IGNORECASE,
-                        timeout=ParserConfig.REGEX_TIMEOUT
+            if headers is None:
+                headers = DocumentParser._scan_headers(text)
+
+            span = DocumentParser._section_span(headers, 'skills', len(text))
+            if span is not None:
+                start, end = span
+                # Limit skills section search to the next header or 1000 chars
+                skills_text = text[start:min(end, start + 1000)].strip()
+
+                # Split by common delimiters
+                skill_items = re.split(r'[,;•·\n]+', skills_text)
+                skill_items = [
+                    s.strip() for s in skill_items
+                    if s.strip() and len(s.strip()) >= ParserConfig.MIN_SKILL_LENGTH
+                ]
+
+                if skill_items:
+                    skill = Skill.model_construct(
+                        category="Technical Skills",
+                        skills=skill_items[:ParserConfig.MAX_SKILLS_COUNT]
                     )
-
-                    if match:
-                        start = match.end()
-                        # Limit skills section search
-                        skills_text = text[start:start+1000].strip()
-
-                        # Split by common delimiters
-                        skill_items = re.split(r'[,;•·\n]+', skills_text)
-                        skill_items = [
-                            s.strip() for s in skill_items
-                            if s.strip() and len(s.strip()) >= ParserConfig.MIN_SKILL_LENGTH
-                        ]
-
-                        if skill_items:
-                            skill = Skill(
-                                category="Technical Skills",
-                                skills=skill_items[:ParserConfig.MAX_SKILLS_COUNT]
-                            )
-                            skills_list.append(skill)
-                            logger.debug(f"Extracted {len(skill_items)} skills")
-                        break
-
-                except TimeoutError:
-                    logger.warning(f"Regex timeout extracting skills for header: {header}")
+                    skills_list.append(skill)
+                    logger.debug(f"Extracted {len(skill_items)} skills")
 
         except Exception as e:
             logger.warning(f"Error extracting skills: {e}")
@@ -535,36 +837,29 @@ class DocumentParser:
         return skills_list
 
     @staticmethod
-    def _identify_sections(text: str) -> Dict[str, Any]:
+    def _identify_sections(text: str, headers: Optional[HeaderScan] = None) -> Dict[str, Any]:
         """Identify all sections in the document."""
         sections = {}
 
         try:
-            for section_type, headers in ParserConfig.SECTION_HEADERS.items():
-                for header in headers:
-                    pattern = rf'(?:^|\n)({re.escape(header)})\s*[:\-]?'
+            if headers is None:
+                headers = DocumentParser._scan_headers(text)
 
-                    try:
-                        match = regex.search(
-                            pattern,
-                            text,
-                            flags=regex.IGNORECASE,
-                            timeout=ParserConfig.REGEX_TIMEOUT
-                        )
-
-                        if match:
-                            sections[section_type] = {
-                                'found': True,
-                                'position': match.start(),
-                                'header': match.group(1)
-                            }
-                            break
-
-                    except TimeoutError:
-                        logger.warning(f"Regex timeout identifying section: {header}")
-                        continue
+            for i, section in enumerate(headers.sections):
+                if section not in sections:
+                    sections[section] = {
+                        'found': True,
+                        'position': headers.positions[i],
+                        'header': headers.headers[i]
+                    }
 
         except Exception as e:
             logger.warning(f"Error identifying sections: {e}")
 
         return sections
+
+
+def _parse_one(item: Tuple[str, str]) -> ResumeContent:
+    """Parse one (file_path, file_type) pair (module-level for pickling)."""
+    file_path, file_type = item
+    return DocumentParser.parse(file_path, file_type)
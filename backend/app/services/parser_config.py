@@ -1,13 +1,28 @@
 """Configuration for document parser."""
 
+import os
 from typing import Dict, List
 
+import ahocorasick
+import regex  # For timeout support
+
 
 class ParserConfig:
     """Configuration constants for document parsing."""
 
     # Text extraction limits
     MAX_RAW_TEXT_LENGTH = 500000  # 500KB - Prevent memory exhaustion
+    PDF_PARSE_WORKERS = 8  # Upper bound for per-page pdfplumber threads
+    # Character-grouping tolerances for the pdfplumber fallback: chars
+    # within 3pt merge into one word/line, enough for resume reading order
+    PDF_X_TOLERANCE = 3
+    PDF_Y_TOLERANCE = 3
+    PARSE_CACHE_SIZE = 256  # Memoized parses kept for re-upload/retry flows
+    # parse_many process-pool size: PARSER_WORKERS overrides, else leave
+    # one core for the event loop
+    PARSE_PROCESS_WORKERS = int(os.getenv('PARSER_WORKERS', 0)) or max(
+        1, (os.cpu_count() or 2) - 1
+    )
     MAX_TEXT_FOR_CONTACT_EXTRACTION = 10000  # First 10KB usually contains contact info
 
     # Summary constraints
@@ -62,9 +77,23 @@ class ParserConfig:
         ],
     }
 
-    # Regex patterns (compiled for performance)
-    EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    PHONE_PATTERN = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+    # Regex patterns. Email and phone use possessive quantifiers (regex
+    # module) so no input can trigger backtracking: the local-part and each
+    # domain label are consumed exactly once. The email label group only
+    # consumes a dot when another label character follows, so a
+    # sentence-ending period after the address stays outside the match.
+    # The phone country-code group commits only when a full 10-digit number
+    # follows (the lookahead), so a bare "1-" prefix is accepted without
+    # ever possessively swallowing the area code of a plain number.
+    EMAIL_PATTERN = (
+        r'\b[A-Za-z0-9._%+-]++@'
+        r'(?:[A-Za-z0-9-]++\.(?=[A-Za-z0-9]))++[A-Za-z]{2,}\b'
+    )
+    PHONE_PATTERN = (
+        r'(?:\+?\d{1,3}[-.\s]?+'
+        r'(?=\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}))?+'
+        r'(?:\(\d{3}\)|\d{3})[-.\s]?+\d{3}[-.\s]?+\d{4}'
+    )
     LINKEDIN_PATTERN = r'linkedin\.com/in/[\w-]+'
 
     # Degree patterns for education extraction
@@ -73,5 +102,33 @@ class ParserConfig:
         r"(University|College|Institute|School)[^\n]{0,100}"
     ]
 
+    # Compiled once at import time: the parse path is CPU-bound on regex
+    # work, and building these per call recompiled every header pattern for
+    # every document (~30+ compiles per resume)
+    # The three contact patterns fused into one alternation with named
+    # groups: the engine walks the contact window once and the caller
+    # dispatches on lastgroup, instead of three separate scans
+    COMPILED_CONTACT = regex.compile(
+        r'(?P<email>' + EMAIL_PATTERN + r')'
+        r'|(?P<linkedin>(?i:' + LINKEDIN_PATTERN + r'))'
+        r'|(?P<phone>' + PHONE_PATTERN + r')'
+    )
+    COMPILED_DEGREE = [
+        regex.compile(p, flags=regex.IGNORECASE) for p in DEGREE_PATTERNS
+    ]
+
+    # Every known header compiled into one Aho-Corasick automaton: a single
+    # linear scan of the lowercased text yields all header positions, instead
+    # of one full-text scan per header (~20 headers) per extractor. The
+    # headers are literal strings, so a multi-pattern automaton cannot
+    # backtrack and needs no timeout guard. Line-boundary context
+    # (own line, optional trailing colon/dash) is checked at each hit.
+    HEADER_AUTOMATON = ahocorasick.Automaton()
+    for _section, _headers in SECTION_HEADERS.items():
+        for _header in _headers:
+            HEADER_AUTOMATON.add_word(_header, (_section, _header))
+    HEADER_AUTOMATON.make_automaton()
+    del _section, _headers, _header
+
     # File cleanup
     FILE_RETENTION_HOURS = 24  # Delete files after 24 hours
@@ -2,7 +2,10 @@
 
 import logging
 from typing import List, Dict, Tuple
-from app.models.resume import ResumeContent
+
+import numpy as np
+
+from app.models.resume import ResumeContent, SECTION_BITS
 from app.models.analysis import GrammarIssue, ATSSuggestion
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,9 @@ class ResumeScorer:
     ATS_WEIGHT = 0.35  # 35%
     CONTENT_WEIGHT = 0.35  # 35%
 
+    # Same weights as one vector for the batch dot product
+    _WEIGHTS = np.array([GRAMMAR_WEIGHT, ATS_WEIGHT, CONTENT_WEIGHT])
+
     # Grammar scoring parameters
     GRAMMAR_PENALTY_PER_ISSUE = 2.0  # Deduct 2 points per grammar issue
     MIN_GRAMMAR_SCORE = 40.0  # Minimum grammar score
@@ -29,6 +35,23 @@ class ResumeScorer:
     MIN_SKILLS = 5
     IDEAL_SKILLS = 15
 
+    # Critical resume sections for ATS compatibility, as a bitmask
+    _REQUIRED_MASK = (SECTION_BITS['experience']
+                      | SECTION_BITS['education']
+                      | SECTION_BITS['skills'])
+
+    # ATS deduction per suggestion importance; one dict probe per
+    # suggestion instead of a branch ladder, and unknown values cost 0
+    _IMPORTANCE_PENALTY = {'high': 10, 'medium': 5, 'low': 2}
+
+    # Rating labels indexed by score decile: int(score) // 10 picks the
+    # label directly, replacing comparisons entirely
+    _RATINGS = (
+        ("Poor",) * 5
+        + ("Needs Improvement", "Fair", "Good", "Very Good")
+        + ("Excellent",) * 2
+    )
+
     @staticmethod
     def calculate_grammar_score(
         text_length: int,
@@ -60,7 +83,8 @@ class ResumeScorer:
         # Apply minimum floor
         score = max(score, ResumeScorer.MIN_GRAMMAR_SCORE)
 
-        logger.info(f"Grammar score: {score:.1f} ({num_issues} issues, {text_length} chars)")
+        logger.info("Grammar score: %.1f (%d issues, %d chars)",
+                    score, num_issues, text_length)
         return round(score, 1)
 
     @staticmethod
@@ -123,7 +147,7 @@ class ResumeScorer:
 
         # Skills section (15 points)
         skills_points = 0
-        total_skills = sum(len(skill.skills) for skill in resume_content.skills)
+        total_skills = resume_content.get_total_skills()
         if total_skills >= ResumeScorer.MIN_SKILLS:
             if total_skills >= ResumeScorer.IDEAL_SKILLS:
                 skills_points = 15
@@ -132,14 +156,72 @@ class ResumeScorer:
                 skills_points = 15 * ratio
         score += skills_points
 
-        logger.info(f"Content score breakdown: contact={contact_points:.1f}, "
-                   f"summary={summary_points:.1f}, experience={experience_points:.1f}, "
-                   f"education={education_points:.1f}, skills={skills_points:.1f}")
+        # Gate the breakdown so no argument tuple is built when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Content score breakdown: contact=%.1f, summary=%.1f, "
+                        "experience=%.1f, education=%.1f, skills=%.1f",
+                        contact_points, summary_points, experience_points,
+                        education_points, skills_points)
 
         final_score = min(score, max_score)
-        logger.info(f"Content score: {final_score:.1f}")
+        logger.info("Content score: %.1f", final_score)
         return round(final_score, 1)
 
+    @staticmethod
+    def score_batch(resumes: List[ResumeContent]) -> np.ndarray:
+        """
+        Calculate content scores for many resumes at once.
+
+        Packs the per-resume counts and flags into NumPy columns and
+        applies the same point formulas as calculate_content_score with
+        vectorized ops, so batch evaluation pays interpreter overhead
+        once instead of per resume. Grammar and ATS scores depend on
+        per-resume issue lists and stay on the scalar path.
+
+        Args:
+            resumes: Parsed resume contents
+
+        Returns:
+            Array of content scores (0-100), one per resume
+        """
+        n = len(resumes)
+        if n == 0:
+            return np.empty(0)
+
+        contacts = [r.contact_info for r in resumes]
+        name_flag = np.fromiter(
+            (bool(c and c.name) for c in contacts), dtype=np.int8, count=n)
+        email_flag = np.fromiter(
+            (bool(c and c.email) for c in contacts), dtype=np.int8, count=n)
+        phone_flag = np.fromiter(
+            (bool(c and c.phone) for c in contacts), dtype=np.int8, count=n)
+        linkedin_flag = np.fromiter(
+            (bool(c and c.linkedin) for c in contacts), dtype=np.int8, count=n)
+        summary_len = np.fromiter(
+            (len(r.summary or '') for r in resumes), dtype=np.int32, count=n)
+        exp_n = np.fromiter(
+            (len(r.experience) for r in resumes), dtype=np.int32, count=n)
+        edu_n = np.fromiter(
+            (len(r.education) for r in resumes), dtype=np.int32, count=n)
+        skills_n = np.fromiter(
+            (r.get_total_skills() for r in resumes), dtype=np.int32, count=n)
+
+        scores = (
+            5.0 * (name_flag + email_flag + phone_flag + linkedin_flag)
+            + 15.0 * np.minimum(
+                summary_len / ResumeScorer.IDEAL_SUMMARY_LENGTH, 1.0
+            ) * (summary_len >= ResumeScorer.MIN_SUMMARY_LENGTH)
+            + 30.0 * np.minimum(
+                exp_n / ResumeScorer.IDEAL_EXPERIENCE_ENTRIES, 1.0
+            ) * (exp_n >= ResumeScorer.MIN_EXPERIENCE_ENTRIES)
+            + 20.0 * (edu_n >= ResumeScorer.MIN_EDUCATION_ENTRIES)
+            + 15.0 * np.minimum(
+                skills_n / ResumeScorer.IDEAL_SKILLS, 1.0
+            ) * (skills_n >= ResumeScorer.MIN_SKILLS)
+        )
+
+        return np.round(np.minimum(scores, 100.0), 1)
+
     @staticmethod
     def calculate_ats_score(
         resume_content: ResumeContent,
@@ -157,32 +239,31 @@ class ResumeScorer:
         """
         score = 100.0
 
-        # Deduct points based on suggestion importance
-        for suggestion in ats_suggestions:
-            if suggestion.importance == "high":
-                score -= 10
-            elif suggestion.importance == "medium":
-                score -= 5
-            elif suggestion.importance == "low":
-                score -= 2
+        # Deduct points based on suggestion importance. The loop touches
+        # one field per suggestion exactly once, so copying into slotted
+        # intermediates would cost more than it saves; the penalty table
+        # keeps the per-item work to a single lookup.
+        penalties = ResumeScorer._IMPORTANCE_PENALTY
+        score -= sum(
+            penalties.get(s.importance, 0) for s in ats_suggestions
+        )
 
         # Bonus points for good structure
         if resume_content.contact_info and resume_content.contact_info.email:
             score += 0  # Already at 100, just checking structure exists
 
-        # Check for required sections
-        sections = resume_content.sections
-        required_sections = ['experience', 'education', 'skills']
-        missing_sections = [s for s in required_sections if s not in sections]
-
-        # Deduct for missing critical sections
-        score -= len(missing_sections) * 15
+        # Deduct for missing critical sections: required-and-not-present
+        # is one mask op and bit_count lowers to POPCNT
+        missing_count = (
+            ResumeScorer._REQUIRED_MASK & ~resume_content.get_section_mask()
+        ).bit_count()
+        score -= missing_count * 15
 
         # Apply bounds
         score = max(0, min(100, score))
 
-        logger.info(f"ATS score: {score:.1f} ({len(ats_suggestions)} suggestions, "
-                   f"{len(missing_sections)} missing sections)")
+        logger.info("ATS score: %.1f (%d suggestions, %d missing sections)",
+                    score, len(ats_suggestions), missing_count)
         return round(score, 1)
 
     @staticmethod
@@ -208,11 +289,25 @@ class ResumeScorer:
             content_score * ResumeScorer.CONTENT_WEIGHT
         )
 
-        logger.info(f"Overall score: {overall:.1f} "
-                   f"(grammar={grammar_score:.1f}, ats={ats_score:.1f}, content={content_score:.1f})")
+        logger.info("Overall score: %.1f (grammar=%.1f, ats=%.1f, content=%.1f)",
+                    overall, grammar_score, ats_score, content_score)
 
         return round(overall, 1)
 
+    @staticmethod
+    def calculate_overall_score_batch(scores: np.ndarray) -> np.ndarray:
+        """
+        Calculate weighted overall scores for a batch.
+
+        Args:
+            scores: Array of shape (N, 3) with grammar, ats and content
+                score columns
+
+        Returns:
+            Array of N overall scores (0-100)
+        """
+        return np.round(scores @ ResumeScorer._WEIGHTS, 1)
+
     @staticmethod
     def get_score_rating(score: float) -> str:
         """
@@ -224,15 +319,4 @@ class ResumeScorer:
         Returns:
             Rating string
         """
-        if score >= 90:
-            return "Excellent"
-        elif score >= 80:
-            return "Very Good"
-        elif score >= 70:
-            return "Good"
-        elif score >= 60:
-            return "Fair"
-        elif score >= 50:
-            return "Needs Improvement"
-        else:
-            return "Poor"
+        return ResumeScorer._RATINGS[max(0, min(int(score) // 10, 10))]
@@ -0,0 +1,159 @@
+"""Shared storage layer for uploads and analyses.
+
+Replaces the module-level in-memory dicts that grew unboundedly and could
+not be shared across uvicorn workers. When REDIS_URL is configured, records
+are serialized with orjson and stored in Redis so worker memory stays flat
+and multiple workers share state. Without Redis the store falls back to an
+in-process dict (graceful degradation, same as the Claude service without
+an API key).
+"""
+
+import logging
+from typing import Optional
+
+import orjson
+from cachetools import TTLCache
+
+from app.config import get_settings
+from app.models.analysis import Analysis
+from app.models.resume import ResumeUpload
+
+logger = logging.getLogger(__name__)
+
+# Key prefixes for Redis storage
+_RESUME_KEY_PREFIX = "resume:"
+_ANALYSIS_KEY_PREFIX = "analysis:"
+
+# In-process fallback store bounds. Entries evict after an hour (matching the
+# spirit of cleanup_old_files for on-disk uploads) so raw_text-heavy records
+# don't accumulate and RSS stays bounded under sustained load.
+_LOCAL_STORE_MAXSIZE = 1000
+_LOCAL_STORE_TTL_SECONDS = 3600
+
+# In-process fallback stores (used when Redis is not configured)
+_local_resumes = TTLCache(maxsize=_LOCAL_STORE_MAXSIZE, ttl=_LOCAL_STORE_TTL_SECONDS)
+_local_analyses = TTLCache(maxsize=_LOCAL_STORE_MAXSIZE, ttl=_LOCAL_STORE_TTL_SECONDS)
+
+# Pre-serialized analysis JSON, populated at store time so reads can return
+# cached bytes without re-serializing the model per request
+_local_analyses_json = TTLCache(maxsize=_LOCAL_STORE_MAXSIZE, ttl=_LOCAL_STORE_TTL_SECONDS)
+
+# Lazily created Redis client (None when REDIS_URL is not set)
+_redis_client = None
+
+
+def _get_redis():
+    """Get or create the shared Redis client (singleton pattern)."""
+    global _redis_client
+    settings = get_settings()
+    if _redis_client is None and settings.REDIS_URL:
+        try:
+            import redis.asyncio as redis
+
+            logger.info("Connecting to Redis storage backend...")
+            _redis_client = redis.from_url(settings.REDIS_URL)
+            logger.info("Redis storage backend initialized")
+        except Exception as e:
+            logger.error(f"Failed to initialize Redis client: {e}")
+            raise
+    return _redis_client
+
+
+async def get_resume(resume_id: str) -> Optional[ResumeUpload]:
+    """
+    Get a stored resume upload by ID.
+
+    Args:
+        resume_id: Upload ID
+
+    Returns:
+        ResumeUpload object, or None if not found
+    """
+    client = _get_redis()
+    if client is None:
+        return _local_resumes.get(resume_id)
+
+    data = await client.get(f"{_RESUME_KEY_PREFIX}{resume_id}")
+    if data is None:
+        return None
+    return ResumeUpload.model_validate(orjson.loads(data))
+
+
+async def set_resume(upload: ResumeUpload) -> None:
+    """
+    Store a resume upload.
+
+    Args:
+        upload: ResumeUpload object to store
+    """
+    client = _get_redis()
+    if client is None:
+        _local_resumes[str(upload.id)] = upload
+        return
+
+    await client.set(
+        f"{_RESUME_KEY_PREFIX}{upload.id}",
+        orjson.dumps(upload.model_dump(mode="json")),
+    )
+
+
+async def get_analysis(analysis_id: str) -> Optional[Analysis]:
+    """
+    Get a stored analysis by ID.
+
+    Args:
+        analysis_id: Analysis ID
+
+    Returns:
+        Analysis object, or None if not found
+    """
+    client = _get_redis()
+    if client is None:
+        return _local_analyses.get(analysis_id)
+
+    data = await client.get(f"{_ANALYSIS_KEY_PREFIX}{analysis_id}")
+    if data is None:
+        return None
+    return Analysis.model_validate(orjson.loads(data))
+
+
+async def set_analysis(analysis: Analysis) -> None:
+    """
+    Store an analysis.
+
+    Args:
+        analysis: Analysis object to store
+    """
+    client = _get_redis()
+    if client is None:
+        _local_analyses[str(analysis.id)] = analysis
+        _local_analyses_json[str(analysis.id)] = orjson.dumps(
+            analysis.model_dump(mode="json")
+        )
+        return
+
+    await client.set(
+        f"{_ANALYSIS_KEY_PREFIX}{analysis.id}",
+        orjson.dumps(analysis.model_dump(mode="json")),
+    )
+
+
+async def get_analysis_json(analysis_id: str) -> Optional[bytes]:
+    """
+    Get a stored analysis as pre-serialized JSON bytes.
+
+    Serialization happens once in set_analysis, so repeated reads skip
+    pydantic/FastAPI response serialization entirely.
+
+    Args:
+        analysis_id: Analysis ID
+
+    Returns:
+        JSON bytes, or None if not found
+    """
+    client = _get_redis()
+    if client is None:
+        return _local_analyses_json.get(analysis_id)
+
+    # Redis already stores the serialized form
+    return await client.get(f"{_ANALYSIS_KEY_PREFIX}{analysis_id}")
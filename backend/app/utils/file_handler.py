@@ -1,17 +1,26 @@
 """File handling utilities."""
 
 import os
-import shutil
 from pathlib import Path
 from uuid import uuid4
 from typing import Tuple
+import aiofiles
 from fastapi import UploadFile, HTTPException
-from app.config import settings
+from app.config import get_settings
+
+# Copy chunk size: large enough to amortize per-chunk overhead, small
+# enough to keep memory bounded under concurrent uploads
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
 
 
 def get_file_extension(filename: str) -> str:
     """Extract file extension from filename."""
-    return Path(filename).suffix.lower()
+    # str.rfind skips PurePath construction and the suffix property chain;
+    # this runs once per validation and once per save
+    i = filename.rfind('.')
+    # Leading dot (hidden file) and trailing dot yield no suffix, matching
+    # Path.suffix
+    return filename[i:].lower() if 0 < i < len(filename) - 1 else ''
 
 
 def validate_file(file: UploadFile) -> Tuple[bool, str]:
@@ -26,8 +35,9 @@ def validate_file(file: UploadFile) -> Tuple[bool, str]:
 
     extension = get_file_extension(file.filename)
 
+    settings = get_settings()
     if extension not in settings.ALLOWED_EXTENSIONS:
-        return False, f"File type {extension} not allowed. Allowed types: {', '.join(settings.ALLOWED_EXTENSIONS)}"
+        return False, f"File type {extension} not allowed. Allowed types: {', '.join(sorted(settings.ALLOWED_EXTENSIONS))}"
 
     return True, ""
 
@@ -47,32 +57,44 @@ async def save_upload_file(file: UploadFile) -> Tuple[str, str]:
     if not is_valid:
         raise HTTPException(status_code=400, detail=error_message)
 
+    settings = get_settings()
+
     # Create upload directory if it doesn't exist
     upload_dir = Path(settings.UPLOAD_DIR)
     upload_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate unique filename
+    # Generate unique filename (.hex skips UUID.__str__ hyphen formatting)
     extension = get_file_extension(file.filename)
     file_type = extension.lstrip(".")
-    unique_filename = f"{uuid4()}{extension}"
+    unique_filename = f"{uuid4().hex}{extension}"
     file_path = upload_dir / unique_filename
-
-    # Check file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
-
-    if file_size > settings.MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE} bytes"
-        )
-
-    # Save file
+    # Write to a sibling and publish with an atomic rename, so a crash
+    # mid-copy never leaves a partial file at the final name
+    tmp_path = file_path.with_name(unique_filename + ".tmp")
+
+    # Save file without blocking the event loop: UploadFile.read offloads
+    # to the threadpool and aiofiles does the same for writes, so other
+    # requests keep being serviced for the duration of the copy. Size is
+    # enforced incrementally during the copy — measuring up front via
+    # seek/tell forced spooled uploads fully into memory and re-read
+    # rolled-over files twice
+    total_bytes = 0
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        async with aiofiles.open(tmp_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                total_bytes += len(chunk)
+                if total_bytes > settings.MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE} bytes"
+                    )
+                await buffer.write(chunk)
+        os.replace(tmp_path, file_path)
+    except HTTPException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
     return str(file_path), file_type
@@ -0,0 +1,25 @@
+"""Tests for ATS optimization service."""
+
+from app.services.ats_optimizer import ATSOptimizer
+
+
+def test_match_keywords_finds_present_keywords():
+    """Test keyword matching against resume text."""
+    text = "Built backend services in Python and Go; deployed with Docker."
+    keywords = ["Python", "Go", "Kubernetes", "Docker"]
+
+    found = ATSOptimizer.match_keywords(text, keywords)
+
+    assert found == {"Python", "Go", "Docker"}
+
+
+def test_match_keywords_is_case_insensitive():
+    """Test keyword matching ignores case."""
+    found = ATSOptimizer.match_keywords("Expert in PYTHON.", ["python"])
+    assert found == {"python"}
+
+
+def test_match_keywords_empty_inputs():
+    """Test keyword matching with empty text or keywords."""
+    assert ATSOptimizer.match_keywords("", ["Python"]) == set()
+    assert ATSOptimizer.match_keywords("some text", []) == set()
@@ -3,11 +3,33 @@
 import pytest
 import json
 from unittest.mock import Mock, AsyncMock, patch
-from app.services.claude_service import ClaudeService, ClaudeConfig
+import app.services.claude_service as claude_service
+from app.services.claude_service import ClaudeService, ClaudeConfig, _response_cache
 from app.models.resume import ResumeContent, Experience, ContactInfo, Skill
 from app.models.analysis import ContentSuggestion
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_state():
+    """Reset the shared response cache and client so tests stay isolated."""
+    _response_cache.clear()
+    claude_service._client = None
+    yield
+    _response_cache.clear()
+    claude_service._client = None
+
+
+def make_stream_client(text):
+    """Build a mock client whose messages.stream yields the given final text."""
+    stream = AsyncMock()
+    stream.get_final_text = AsyncMock(return_value=text)
+    cm = AsyncMock()
+    cm.__aenter__.return_value = stream
+    client = AsyncMock()
+    client.messages.stream = Mock(return_value=cm)
+    return client
+
+
 @pytest.fixture
 def mock_anthropic_client():
     """Create a mock Anthropic client."""
@@ -49,16 +71,16 @@ class TestClaudeServiceInitialization:
 
     def test_initialization_without_api_key(self):
         """Test that service handles missing API key gracefully."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = ""
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = ""
             service = ClaudeService()
             assert service.client is None
             assert not service._is_available()
 
     def test_initialization_with_api_key(self, mock_anthropic_client):
         """Test that service initializes with API key."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
             service = ClaudeService()
             assert service._is_available()
 
@@ -69,8 +91,8 @@ class TestAnalyzeContent:
     @pytest.mark.asyncio
     async def test_analyze_content_without_api_key(self, sample_resume_content):
         """Test that analyze_content returns empty list without API key."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = ""
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = ""
             service = ClaudeService()
             suggestions = await service.analyze_content(sample_resume_content)
             assert suggestions == []
@@ -78,8 +100,8 @@ class TestAnalyzeContent:
     @pytest.mark.asyncio
     async def test_analyze_content_with_summary(self, mock_anthropic_client, sample_resume_content):
         """Test content analysis with summary section."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
             # Mock the API response
             mock_response = Mock()
@@ -105,8 +127,8 @@ class TestAnalyzeContent:
     @pytest.mark.asyncio
     async def test_analyze_content_with_experience(self, mock_anthropic_client, sample_resume_content):
         """Test content analysis with experience section."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
             # Mock multiple API responses (summary + experience)
             mock_response = Mock()
@@ -132,8 +154,8 @@ class TestAnalyzeContent:
     @pytest.mark.asyncio
     async def test_analyze_content_limits_suggestions(self, mock_anthropic_client, sample_resume_content):
         """Test that analyze_content limits total suggestions to 10."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
             # Create content with many sections
             sample_resume_content.experience = [
@@ -169,8 +191,8 @@ class TestAnalyzeContent:
     @pytest.mark.asyncio
     async def test_analyze_content_handles_api_error(self, mock_anthropic_client, sample_resume_content):
         """Test that analyze_content handles API errors gracefully."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
             mock_client = AsyncMock()
             mock_client.messages.create = AsyncMock(side_effect=Exception("API error"))
@@ -185,8 +207,8 @@ class TestAnalyzeContent:
     @pytest.mark.asyncio
     async def test_analyze_content_handles_json_parse_error(self, mock_anthropic_client, sample_resume_content):
         """Test that analyze_content handles malformed JSON responses."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
             mock_response = Mock()
             mock_content = Mock()
@@ -210,8 +232,8 @@ class TestImproveSummary:
     @pytest.mark.asyncio
     async def test_improve_summary_without_api_key(self):
         """Test that improve_summary returns original without API key."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = ""
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = ""
             service = ClaudeService()
 
             original = "Software engineer with experience."
@@ -221,16 +243,12 @@ class TestImproveSummary:
     @pytest.mark.asyncio
     async def test_improve_summary_with_valid_input(self, mock_anthropic_client):
         """Test summary improvement with valid input."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
-
-            mock_response = Mock()
-            mock_content = Mock()
-            mock_content.text = "Improved professional summary with metrics and achievements."
-            mock_response.content = [mock_content]
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
-            mock_client = AsyncMock()
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_client = make_stream_client(
+                "Improved professional summary with metrics and achievements."
+            )
             mock_anthropic_client.return_value = mock_client
 
             service = ClaudeService()
@@ -243,8 +261,8 @@ class TestImproveSummary:
     @pytest.mark.asyncio
     async def test_improve_summary_with_empty_input(self):
         """Test that improve_summary handles empty input."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
             service = ClaudeService()
 
             result = await service.improve_summary("")
@@ -253,8 +271,8 @@ class TestImproveSummary:
     @pytest.mark.asyncio
     async def test_improve_summary_with_short_input(self):
         """Test that improve_summary handles very short input."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
             service = ClaudeService()
 
             short_text = "Hi"
@@ -264,16 +282,10 @@ class TestImproveSummary:
     @pytest.mark.asyncio
     async def test_improve_summary_truncates_long_input(self, mock_anthropic_client):
         """Test that improve_summary truncates very long input."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
-
-            mock_response = Mock()
-            mock_content = Mock()
-            mock_content.text = "Improved summary"
-            mock_response.content = [mock_content]
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
-            mock_client = AsyncMock()
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_client = make_stream_client("Improved summary")
             mock_anthropic_client.return_value = mock_client
 
             service = ClaudeService()
@@ -283,16 +295,16 @@ class TestImproveSummary:
             result = await service.improve_summary(long_text)
 
             # Should call API (text is truncated internally)
-            mock_client.messages.create.assert_called_once()
+            mock_client.messages.stream.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_improve_summary_handles_api_error(self, mock_anthropic_client):
         """Test that improve_summary handles API errors."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
             mock_client = AsyncMock()
-            mock_client.messages.create = AsyncMock(side_effect=Exception("API error"))
+            mock_client.messages.stream = Mock(side_effect=Exception("API error"))
             mock_anthropic_client.return_value = mock_client
 
             service = ClaudeService()
@@ -309,8 +321,8 @@ class TestImproveBulletPoints:
     @pytest.mark.asyncio
     async def test_improve_bullet_points_without_api_key(self):
         """Test that improve_bullet_points returns original without API key."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = ""
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = ""
             service = ClaudeService()
 
             bullets = ["Did work", "Fixed bugs"]
@@ -320,17 +332,13 @@ class TestImproveBulletPoints:
     @pytest.mark.asyncio
     async def test_improve_bullet_points_with_valid_input(self, mock_anthropic_client):
         """Test bullet point improvement with valid input."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
-            mock_response = Mock()
-            mock_content = Mock()
-            mock_content.text = """1. Architected and delivered microservices handling 1M+ requests
+            mock_client = make_stream_client(
+                """1. Architected and delivered microservices handling 1M+ requests
 2. Resolved critical bugs reducing downtime by 95%"""
-            mock_response.content = [mock_content]
-
-            mock_client = AsyncMock()
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            )
             mock_anthropic_client.return_value = mock_client
 
             service = ClaudeService()
@@ -343,8 +351,8 @@ class TestImproveBulletPoints:
     @pytest.mark.asyncio
     async def test_improve_bullet_points_with_empty_input(self):
         """Test that improve_bullet_points handles empty input."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
             service = ClaudeService()
 
             result = await service.improve_bullet_points([])
@@ -353,16 +361,12 @@ class TestImproveBulletPoints:
     @pytest.mark.asyncio
     async def test_improve_bullet_points_limits_to_five(self, mock_anthropic_client):
         """Test that improve_bullet_points only processes first 5 bullets."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
-            mock_response = Mock()
-            mock_content = Mock()
-            mock_content.text = "\n".join([f"{i}. Improved bullet {i}" for i in range(1, 6)])
-            mock_response.content = [mock_content]
-
-            mock_client = AsyncMock()
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_client = make_stream_client(
+                "\n".join(f"{i}. Improved bullet {i}" for i in range(1, 6))
+            )
             mock_anthropic_client.return_value = mock_client
 
             service = ClaudeService()
@@ -375,16 +379,10 @@ class TestImproveBulletPoints:
     @pytest.mark.asyncio
     async def test_improve_bullet_points_handles_mismatch(self, mock_anthropic_client):
         """Test handling when API returns wrong number of bullets."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
-            mock_response = Mock()
-            mock_content = Mock()
-            mock_content.text = "1. Only one bullet"
-            mock_response.content = [mock_content]
-
-            mock_client = AsyncMock()
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_client = make_stream_client("1. Only one bullet")
             mock_anthropic_client.return_value = mock_client
 
             service = ClaudeService()
@@ -397,11 +395,11 @@ class TestImproveBulletPoints:
     @pytest.mark.asyncio
     async def test_improve_bullet_points_handles_api_error(self, mock_anthropic_client):
         """Test that improve_bullet_points handles API errors."""
-        with patch('app.services.claude_service.settings') as mock_settings:
-            mock_settings.CLAUDE_API_KEY = "test-api-key"
+        with patch('app.services.claude_service.get_settings') as mock_get_settings:
+            mock_get_settings.return_value.CLAUDE_API_KEY = "test-api-key"
 
             mock_client = AsyncMock()
-            mock_client.messages.create = AsyncMock(side_effect=Exception("API error"))
+            mock_client.messages.stream = Mock(side_effect=Exception("API error"))
             mock_anthropic_client.return_value = mock_client
 
             service = ClaudeService()
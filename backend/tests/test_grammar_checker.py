@@ -84,3 +84,52 @@ def test_grammar_checker_config():
     assert GrammarChecker.MAX_TEXT_LENGTH > 0
     assert isinstance(GrammarChecker.IGNORED_CATEGORIES, set)
     assert len(GrammarChecker.IGNORED_CATEGORIES) > 0
+
+
+@pytest.mark.asyncio
+async def test_check_grammar_cache_hit_returns_copies():
+    """Test that cache hits return copies, not the cached objects."""
+    import hashlib
+    from app.services import grammar_checker
+
+    text = "Cached text for the copy test."
+    key = (hashlib.sha256(text.encode()).digest(), 50)
+    master = [GrammarIssue(
+        text="context", message="msg", suggestions=[],
+        category="GRAMMAR", line=1, offset=0
+    )]
+    grammar_checker._GRAMMAR_CACHE[key] = master
+    try:
+        issues = await GrammarChecker.check_grammar(text)
+        assert issues[0] is not master[0]
+        assert issues[0] == master[0]
+    finally:
+        grammar_checker._GRAMMAR_CACHE.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_check_grammar_by_section_does_not_poison_cache():
+    """Test that section relabelling never leaks into cached results."""
+    import hashlib
+    from app.services import grammar_checker
+
+    text = "Cached text for the relabel test."
+    key = (hashlib.sha256(text.encode()).digest(), 50)
+    grammar_checker._GRAMMAR_CACHE[key] = [GrammarIssue(
+        text="context", message="msg", suggestions=[],
+        category="GRAMMAR", line=1, offset=0
+    )]
+    try:
+        labelled = await GrammarChecker.check_grammar_by_section(text, "summary")
+        assert labelled[0].category == "summary: GRAMMAR"
+
+        # A plain hit afterwards must come back unlabelled
+        plain = await GrammarChecker.check_grammar(text)
+        assert plain[0].category == "GRAMMAR"
+
+        # And a second sectioned hit must not double-prefix
+        relabelled = await GrammarChecker.check_grammar_by_section(text, "experience")
+        assert relabelled[0].category == "experience: GRAMMAR"
+    finally:
+        grammar_checker._GRAMMAR_CACHE.pop(key, None)
+
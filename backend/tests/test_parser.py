@@ -87,3 +87,94 @@ def test_normalize_phone():
     assert DocumentParser._normalize_phone("(555) 123-4567") == "5551234567"
     assert DocumentParser._normalize_phone("+1-555-123-4567") == "+15551234567"
     assert DocumentParser._normalize_phone("555.123.4567") == "5551234567"
+
+
+def test_identify_sections_inline_header():
+    """Test that a header with inline content is still identified."""
+    text = "John Doe\n\nSkills: Python, Java, SQL\n"
+    sections = DocumentParser._identify_sections(text)
+
+    assert 'skills' in sections
+
+
+def test_identify_sections_header_at_eof():
+    """Test that a header on the last line without a newline is found."""
+    text = "John Doe\n\nExperience\nDid things at Acme.\n\nSkills"
+    sections = DocumentParser._identify_sections(text)
+
+    assert 'experience' in sections
+    assert 'skills' in sections
+
+
+def test_scan_headers_ignores_embedded_words():
+    """Test that header words inside longer words don't match."""
+    text = "A skillset for experienced engineers.\n"
+    sections = DocumentParser._identify_sections(text)
+
+    assert sections == {}
+
+
+def test_error_result_has_raw_text_len():
+    """Test that error-path results still carry a usable text length."""
+    result = DocumentParser.parse_pdf("dummy.pdf")
+
+    assert result.raw_text
+    assert result.raw_text_len == len(result.raw_text)
+
+
+def _make_docx_bytes(text: str) -> bytes:
+    """Build a minimal DOCX archive containing one paragraph."""
+    import io
+    import zipfile
+
+    ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{ns}"><w:body>'
+            f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+            f'</w:body></w:document>',
+        )
+    return buf.getvalue()
+
+
+def test_parse_bytes_caches_by_content_digest():
+    """Test that re-parsing identical bytes hits the digest-keyed cache."""
+    data = _make_docx_bytes("John Doe cache test john.cache@example.com")
+
+    # Different file paths (fresh uuid names per upload) must still hit
+    first = DocumentParser._parse_bytes(data, "docx", "uploads/aaa.docx")
+    second = DocumentParser._parse_bytes(data, "docx", "uploads/bbb.docx")
+
+    assert "cache test" in first.raw_text
+    assert second is first
+
+
+def test_sanitize_text_removes_unicode_nonprintables():
+    """Test that zero-width and bidi characters are stripped."""
+    dirty = "Jane\u200b Doe\ufeff\u00adResume\u2028Skills\u202e\u2066x"
+    result = DocumentParser._sanitize_text(dirty)
+
+    assert result == "Jane DoeResumeSkillsx"
+
+    # Accented characters must survive
+    assert DocumentParser._sanitize_text("R\u00e9sum\u00e9") == "R\u00e9sum\u00e9"
+
+
+def test_extract_contact_info_email_before_period():
+    """Test that a sentence-ending period stays out of the email."""
+    text = "Jane Roe\nContact me at jane.roe@example.com. Thanks!"
+    contact = DocumentParser._extract_contact_info(text)
+
+    assert contact is not None
+    assert contact.email == "jane.roe@example.com"
+
+
+def test_extract_contact_info_bare_country_code():
+    """Test that a country code without '+' is kept in the phone."""
+    text = "Jane Roe\nPhone: 1-555-123-4567"
+    contact = DocumentParser._extract_contact_info(text)
+
+    assert contact is not None
+    assert contact.phone == "15551234567"
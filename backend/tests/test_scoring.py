@@ -156,3 +156,54 @@ def test_scoring_weights_sum_to_one():
              ResumeScorer.CONTENT_WEIGHT)
 
     assert total == pytest.approx(1.0, 0.001)
+
+
+def test_score_batch_matches_scalar():
+    """Test batch content scoring matches the scalar path."""
+    resumes = [
+        ResumeContent(
+            contact_info=ContactInfo(name="John Doe", email="john@example.com"),
+            summary="A" * 120,
+            experience=[Experience(company="Acme", position="Engineer")],
+            education=[Education(institution="MIT")],
+            skills=[Skill(category="Technical", skills=["Python", "Go", "SQL"])],
+        ),
+        ResumeContent(),
+        ResumeContent(
+            contact_info=ContactInfo(
+                name="Jane Roe", email="jane@example.com",
+                phone="5551234567", linkedin="https://linkedin.com/in/janeroe",
+            ),
+            summary="B" * 300,
+            experience=[
+                Experience(company=c, position="Engineer")
+                for c in ("A", "B", "C", "D")
+            ],
+            education=[Education(institution="MIT")],
+            skills=[Skill(category="Technical", skills=[str(i) for i in range(20)])],
+        ),
+    ]
+
+    batch = ResumeScorer.score_batch(resumes)
+
+    assert len(batch) == len(resumes)
+    for got, resume in zip(batch, resumes):
+        assert got == pytest.approx(
+            ResumeScorer.calculate_content_score(resume), 0.1)
+
+
+def test_score_batch_empty():
+    """Test batch scoring with no resumes."""
+    assert len(ResumeScorer.score_batch([])) == 0
+
+
+def test_calculate_overall_score_batch_matches_scalar():
+    """Test batch overall scoring matches the scalar path."""
+    import numpy as np
+
+    rows = [(90.0, 85.0, 80.0), (100.0, 100.0, 100.0), (0.0, 40.0, 55.5)]
+    batch = ResumeScorer.calculate_overall_score_batch(np.array(rows))
+
+    for got, (grammar, ats, content) in zip(batch, rows):
+        assert got == pytest.approx(
+            ResumeScorer.calculate_overall_score(grammar, ats, content), 0.1)
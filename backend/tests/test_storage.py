@@ -0,0 +1,81 @@
+"""Tests for the shared storage layer (local fallback backend)."""
+
+import orjson
+import pytest
+
+from app import storage
+from app.models.analysis import Analysis
+from app.models.resume import ResumeUpload
+
+
+def _make_upload() -> ResumeUpload:
+    """Build a minimal upload record."""
+    return ResumeUpload(
+        filename="resume.pdf",
+        file_type="pdf",
+        file_path="uploads/resume.pdf",
+    )
+
+
+@pytest.mark.asyncio
+async def test_resume_round_trip():
+    """Test storing and retrieving a resume upload."""
+    upload = _make_upload()
+
+    await storage.set_resume(upload)
+    try:
+        stored = await storage.get_resume(str(upload.id))
+
+        assert stored is not None
+        assert stored.id == upload.id
+        assert stored.filename == "resume.pdf"
+    finally:
+        storage._local_resumes.pop(str(upload.id), None)
+
+
+@pytest.mark.asyncio
+async def test_get_resume_miss_returns_none():
+    """Test that an unknown resume ID returns None."""
+    assert await storage.get_resume("no-such-id") is None
+
+
+@pytest.mark.asyncio
+async def test_analysis_round_trip():
+    """Test storing and retrieving an analysis."""
+    upload = _make_upload()
+    analysis = Analysis(resume_id=upload.id, overall_score=82.5)
+
+    await storage.set_analysis(analysis)
+    try:
+        stored = await storage.get_analysis(str(analysis.id))
+
+        assert stored is not None
+        assert stored.id == analysis.id
+        assert stored.overall_score == 82.5
+    finally:
+        storage._local_analyses.pop(str(analysis.id), None)
+        storage._local_analyses_json.pop(str(analysis.id), None)
+
+
+@pytest.mark.asyncio
+async def test_get_analysis_json_matches_model():
+    """Test that the pre-serialized JSON matches the stored analysis."""
+    upload = _make_upload()
+    analysis = Analysis(resume_id=upload.id, overall_score=90.0)
+
+    await storage.set_analysis(analysis)
+    try:
+        data = await storage.get_analysis_json(str(analysis.id))
+
+        assert isinstance(data, bytes)
+        assert orjson.loads(data) == analysis.model_dump(mode="json")
+    finally:
+        storage._local_analyses.pop(str(analysis.id), None)
+        storage._local_analyses_json.pop(str(analysis.id), None)
+
+
+@pytest.mark.asyncio
+async def test_get_analysis_miss_returns_none():
+    """Test that an unknown analysis ID returns None on both read paths."""
+    assert await storage.get_analysis("no-such-id") is None
+    assert await storage.get_analysis_json("no-such-id") is None